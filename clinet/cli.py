@@ -2,12 +2,12 @@ import argparse
 import os
 
 from .main import FMClient
+from .mysql_client import MySQLConfig, MySQLRadioDB
+from .tts_cache import default_cache_dir
 
 
-DEFAULT_MYSQL_HOST = "mysql-2367c49a-radio-65e8.d.aivencloud.com"
+# Connection secrets come from the environment (or flags) only.
 DEFAULT_MYSQL_PORT = 14239
-DEFAULT_MYSQL_USER = "avnadmin"
-DEFAULT_MYSQL_PASSWORD = "AVNS_H78iyks9IERyxay-J86"
 DEFAULT_MYSQL_DATABASE = "defaultdb"
 
 
@@ -21,13 +21,27 @@ def build_parser() -> argparse.ArgumentParser:
     # Fixed-row music mode (your DB updates id=1 continuously)
     parser.add_argument("--music-id", type=int, default=1)
     parser.add_argument("--music-watch-interval", type=float, default=1.0)
+    parser.add_argument("--status-watch-interval", type=float, default=0.5)
+    parser.add_argument("--alert-check-interval", type=float, default=0.5)
+    # The music watcher backs off towards this interval while nothing changes.
+    parser.add_argument("--max-watch-interval", type=float, default=5.0)
 
-    parser.add_argument("--mysql-host", default=os.getenv("MYSQL_HOST", DEFAULT_MYSQL_HOST))
+    # Rendered TTS audio is cached here; pass an empty string to disable.
+    parser.add_argument(
+        "--tts-cache-dir",
+        default=os.getenv("TTS_CACHE_DIR", default_cache_dir()),
+    )
+
+    parser.add_argument("--mysql-host", default=os.getenv("MYSQL_HOST", ""))
     parser.add_argument("--mysql-port", type=int, default=int(os.getenv("MYSQL_PORT", DEFAULT_MYSQL_PORT)))
-    parser.add_argument("--mysql-user", default=os.getenv("MYSQL_USER", DEFAULT_MYSQL_USER))
-    parser.add_argument("--mysql-password", default=os.getenv("MYSQL_PASSWORD", DEFAULT_MYSQL_PASSWORD))
+    parser.add_argument("--mysql-user", default=os.getenv("MYSQL_USER", ""))
+    parser.add_argument("--mysql-password", default=os.getenv("MYSQL_PASSWORD", ""))
     parser.add_argument("--mysql-database", default=os.getenv("MYSQL_DATABASE", DEFAULT_MYSQL_DATABASE))
     parser.add_argument("--mysql-timeout", type=int, default=10)
+    parser.add_argument("--mysql-pool-size", type=int, default=3)
+    parser.add_argument("--mysql-compress", action=argparse.BooleanOptionalAction, default=True)
+    # Add the alert-table indexes (needs ALTER privilege) and exit.
+    parser.add_argument("--ensure-indexes", action="store_true")
 
     return parser
 
@@ -36,6 +50,27 @@ def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    if not args.mysql_host or not args.mysql_user or not args.mysql_password:
+        parser.error(
+            "missing MySQL connection info: set MYSQL_HOST/MYSQL_USER/MYSQL_PASSWORD "
+            "or pass --mysql-host/--mysql-user/--mysql-password"
+        )
+
+    if args.ensure_indexes:
+        db = MySQLRadioDB(
+            MySQLConfig(
+                host=args.mysql_host,
+                port=args.mysql_port,
+                user=args.mysql_user,
+                password=args.mysql_password,
+                database=args.mysql_database,
+                connection_timeout=args.mysql_timeout,
+                pool_size=1,
+                compress=args.mysql_compress,
+            )
+        )
+        raise SystemExit(0 if db.ensure_indexes() else 1)
+
     client = FMClient(
         mysql_host=args.mysql_host,
         mysql_port=args.mysql_port,
@@ -43,11 +78,17 @@ def main(argv: list[str] | None = None) -> None:
         mysql_password=args.mysql_password,
         mysql_database=args.mysql_database,
         mysql_timeout=args.mysql_timeout,
+        mysql_pool_size=args.mysql_pool_size,
+        mysql_compress=args.mysql_compress,
         state_path=args.state,
         poll_interval=args.poll,
         default_duration=args.default_duration,
         music_id=args.music_id,
         music_watch_interval=args.music_watch_interval,
+        status_watch_interval=args.status_watch_interval,
+        max_watch_interval=args.max_watch_interval,
+        tts_cache_dir=args.tts_cache_dir,
+        alert_check_interval=args.alert_check_interval,
     )
 
     client.run()
@@ -2,9 +2,20 @@ from __future__ import annotations
 
 import argparse
 import os
-from typing import Any
+from typing import Any, Iterable
 
-import mysql.connector
+
+_SAMPLE_COLS = "SELECT id, message, CAST(message AS BINARY) AS raw_msg, CHAR_LENGTH(message) AS chars_len "
+
+# table -> (sample by id, latest sample). Doubles as the table whitelist, so
+# no table name is ever interpolated into SQL at runtime.
+_SAMPLE_SQL = {
+	table: (
+		_SAMPLE_COLS + f"FROM {table} WHERE id=%s",
+		_SAMPLE_COLS + f"FROM {table} ORDER BY id DESC LIMIT 1",
+	)
+	for table in ("ai_alert", "user_alert")
+}
 
 
 def _mask(s: str) -> str:
@@ -15,23 +26,27 @@ def _mask(s: str) -> str:
 	return s[:2] + "****" + s[-2:]
 
 
-def _print_kv(title: str, rows: list[tuple[Any, ...]]):
+def _print_kv(title: str, rows: Iterable[tuple[Any, ...]]):
 	print(f"\n== {title} ==")
 	for row in rows:
 		print("  ", *row)
 
 
-def main() -> None:
+def _parse_args():
 	parser = argparse.ArgumentParser(description="Debug MySQL charset/collation for Malayalam alerts")
 	parser.add_argument("--host", default=os.getenv("MYSQL_HOST", ""))
 	parser.add_argument("--port", type=int, default=int(os.getenv("MYSQL_PORT", "14239")))
 	parser.add_argument("--user", default=os.getenv("MYSQL_USER", ""))
 	parser.add_argument("--password", default=os.getenv("MYSQL_PASSWORD", ""))
 	parser.add_argument("--database", default=os.getenv("MYSQL_DATABASE", "defaultdb"))
-	parser.add_argument("--table", choices=["ai_alert", "user_alert"], default="ai_alert")
+	parser.add_argument("--table", choices=sorted(_SAMPLE_SQL), default="ai_alert")
 	parser.add_argument("--id", type=int, default=0, help="Optional alert id to inspect")
 
-	args = parser.parse_args()
+	return parser.parse_args()
+
+
+def main() -> None:
+	args = _parse_args()
 
 	if not args.host or not args.user or not args.password:
 		raise SystemExit(
@@ -45,6 +60,9 @@ def main() -> None:
 	print(f"  password={_mask(args.password)}")
 	print(f"  database={args.database}")
 
+	# Imported only once the arguments are valid, so --help stays cheap.
+	import mysql.connector
+
 	conn = mysql.connector.connect(
 		host=args.host,
 		port=args.port,
@@ -53,49 +71,49 @@ def main() -> None:
 		database=args.database,
 		use_unicode=True,
 		charset="utf8mb4",
+		use_pure=False,
+		compress=True,
 	)
 	try:
 		cur = conn.cursor()
 
+		# Server/session variables and the table collation in one round-trip.
 		cur.execute(
 			"SELECT @@version, @@character_set_server, @@collation_server, "
-			"@@character_set_database, @@collation_database"
+			"@@character_set_database, @@collation_database, "
+			"@@character_set_client, @@collation_connection, "
+			"@@character_set_connection, @@character_set_results, "
+			"(SELECT TABLE_COLLATION FROM information_schema.TABLES "
+			"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s)",
+			(args.table,),
 		)
-		_print_kv("Server", [cur.fetchone()])
+		variables = cur.fetchone()
+		_print_kv("Server", [variables[:5]])
+		_print_kv("Session", [variables[5:9]])
+		if variables[9] is not None:
+			_print_kv("Table status (Name, Collation)", [(args.table, variables[9])])
 
 		cur.execute(
-			"SELECT @@character_set_client, @@collation_connection, "
-			"@@character_set_connection, @@character_set_results"
+			"SELECT COLUMN_NAME, COLUMN_TYPE, COLLATION_NAME FROM information_schema.COLUMNS "
+			"WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+			(args.table,),
 		)
-		_print_kv("Session", [cur.fetchone()])
-
-		cur.execute("SHOW TABLE STATUS LIKE %s", (args.table,))
-		row = cur.fetchone()
-		if row:
-			# Name is col 0, Collation is col 14
-			_print_kv("Table status (Name, Collation)", [(row[0], row[14])])
-
-		cur.execute(f"SHOW FULL COLUMNS FROM {args.table}")
-		cols = cur.fetchall() or []
-		# Field, Type, Collation
-		simplified = [(c[0], c[1], c[2]) for c in cols]
-		_print_kv("Columns (Field, Type, Collation)", simplified)
+		# Rows are printed as they arrive instead of being collected first.
+		_print_kv("Columns (Field, Type, Collation)", cur)
 
 		# Inspect one message row
+		by_id, latest = _SAMPLE_SQL[args.table]
 		if args.id and args.id > 0:
-			cur.execute(
-				f"SELECT id, message, HEX(message) AS hex_msg, LENGTH(message) AS bytes_len, CHAR_LENGTH(message) AS chars_len "
-				f"FROM {args.table} WHERE id=%s",
-				(int(args.id),),
-			)
+			cur.execute(by_id, (int(args.id),))
 		else:
-			cur.execute(
-				f"SELECT id, message, HEX(message) AS hex_msg, LENGTH(message) AS bytes_len, CHAR_LENGTH(message) AS chars_len "
-				f"FROM {args.table} ORDER BY id DESC LIMIT 1"
-			)
+			cur.execute(latest)
 		msg_row = cur.fetchone()
 		if msg_row:
-			alert_id, message, hex_msg, bytes_len, chars_len = msg_row
+			alert_id, message, raw_msg, chars_len = msg_row
+			# Stored bytes are shipped once and hexed client-side (was HEX()/LENGTH()).
+			raw_msg = bytes(raw_msg) if raw_msg is not None else b""
+			bytes_len = len(raw_msg)
+			hex_msg = raw_msg.hex().upper()
 			print("\n== Sample message ==")
 			print(f"  id={alert_id}")
 			print(f"  repr={message!r}")
@@ -1,29 +1,88 @@
 import argparse
+import atexit
+import functools
 import os
 import re
 import subprocess
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from .mysql_client import MySQLConfig, MySQLRadioDB
-from .state import load_state, save_state
+from .state import load_state, read_json, save_state, write_json
 from .tts import detect_language, generate_voice_from_text
+from .tts_cache import TTSCache
 from .ytdlp_player import StreamPlayer, get_media_duration_seconds
 
 
+# Alert messages use `|` or newlines to separate parts spoken separately.
+_SPLIT_RE = re.compile(r"[|\n]+")
+# Zero-width / direction markers that leave nothing speakable on their own.
+_CTRL_RE = re.compile(r"[\u200b-\u200f\u202a-\u202e]")
+_TRUTHY = frozenset({"1", "true", "True", "yes", "YES"})
+# Server statuses (normalized: stripped, lower-case) that allow audio.
+_AUDIO_STATUSES = frozenset({"net", "both"})
+
+
+class TTSCancelled(RuntimeError):
+    """An utterance was cut off by `FMClient.cancel_current_tts()`."""
+
+
+@functools.lru_cache(maxsize=8)
+def _ffplay_tts_argv(ffplay: str, volume: int, gain: float, from_pipe: bool) -> tuple:
+    """ffplay argv for TTS playback, minus the input file.
+
+    `ffplay` is the executable `StreamPlayer` resolved, so music and TTS run
+    the same binary. Only a couple of (volume, gain) pairs are ever used, so
+    each argv is built once and reused for every utterance.
+    """
+    argv = [ffplay, "-nodisp", "-autoexit", "-loglevel", "error", "-volume", str(max(0, min(100, volume)))]
+    if gain != 1.0:
+        argv.extend(["-af", f"volume={gain}"])
+    if from_pipe:
+        # Decode straight from the pipe; don't wait to fill probe buffers.
+        argv.extend(["-fflags", "nobuffer", "-i", "pipe:0"])
+    return tuple(argv)
+
+
+class _AdaptiveInterval:
+    """Poll interval that backs off while nothing changes and snaps back on a change."""
+
+    def __init__(self, min_s: float, max_s: float, factor: float = 1.5):
+        self.min_s = max(0.2, float(min_s))
+        self.max_s = max(self.min_s, float(max_s))
+        self.factor = float(factor)
+        self.current = self.min_s
+
+    def next(self, changed: bool) -> float:
+        if changed:
+            self.current = self.min_s
+        else:
+            self.current = min(self.max_s, self.current * self.factor)
+        return self.current
+
+
 class FMClient:
     def start_client_state_reset_monitor(self, state_path=None, poll_interval=1.0, reset_delay=5.0):
-        import threading, json, time, os
+        import threading, time, os
         if state_path is None:
             state_path = os.path.join(os.path.dirname(__file__), '..', 'client_state.json')
         state_path = os.path.abspath(state_path)
         last_seen = {"last_ai_alert_id": 0, "last_user_alert_id": 0}
         change_times = {"last_ai_alert_id": None, "last_user_alert_id": None}
         def monitor():
+            last_mtime = None
             while True:
                 try:
-                    with open(state_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    # Only re-read the file when it changed on disk or a reset is due.
+                    mtime = os.stat(state_path).st_mtime_ns
+                    pending = any(t is not None for t in change_times.values())
+                    if mtime == last_mtime and not pending:
+                        time.sleep(poll_interval)
+                        continue
+                    last_mtime = mtime
+                    data = read_json(state_path)
                     changed = False
                     now = time.time()
                     for key in ("last_ai_alert_id", "last_user_alert_id"):
@@ -41,8 +100,7 @@ class FMClient:
                             change_times[key] = None
                             changed = True
                     if changed:
-                        with open(state_path, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
+                        write_json(state_path, data)
                 except Exception as e:
                     print(f"[client_state reset monitor] Error: {e}")
                 time.sleep(poll_interval)
@@ -56,11 +114,17 @@ class FMClient:
         mysql_password,
         mysql_database,
         mysql_timeout=10,
+        mysql_pool_size=3,
+        mysql_compress=True,
         state_path="client_state.json",
         poll_interval=3,
         default_duration=180,
         music_id: int = 1,
         music_watch_interval: float = 1.0,
+        status_watch_interval: float = 0.5,
+        max_watch_interval: float = 5.0,
+        tts_cache_dir: str | None = None,
+        alert_check_interval: float = 0.5,
     ):
         self.cfg = MySQLConfig(
             host=mysql_host,
@@ -69,42 +133,65 @@ class FMClient:
             password=mysql_password,
             database=mysql_database,
             connection_timeout=mysql_timeout,
+            pool_size=mysql_pool_size,
+            compress=mysql_compress,
         )
 
         self.db = MySQLRadioDB(self.cfg)
         self.player = StreamPlayer()
+        # Background work that must not block the playback loop (duration probes).
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fm-worker")
+        # link -> duration in seconds, see `_probe_duration()`.
+        self._duration_cache: dict[str, int] = {}
 
         self.state_path = state_path
         self.state = load_state(state_path)
+        # Hot-path state changes only set this; a writer thread saves at most
+        # once per `state_flush_interval` (see `_mark_state_dirty()`).
+        self.state_flush_interval = 1.0
+        self._state_dirty = threading.Event()
+        self._state_write_lock = threading.Lock()
 
-        self.poll_interval = poll_interval
-        self.default_duration = default_duration
+        self.poll_interval = float(poll_interval)
+        self.default_duration = int(default_duration)
 
         # If your DB always overwrites a single row (e.g. id=1) with the current track,
         # enable this mode by setting music_id=1 (default).
         self.music_id = int(music_id)
         self.music_watch_interval = float(music_watch_interval)
 
+        # MySQL has no server push, so alerts are polled while music plays.
+        self.alert_check_interval = max(0.1, float(alert_check_interval))
+
+        # Set whenever the playback loops have something to react to (music or
+        # status change, finished duration probe); they wait on it between checks.
+        self._wakeup = threading.Event()
+
         self._music_lock = threading.Lock()
         self._desired_music = None
         self._music_change_event = threading.Event()
         self._music_watch_stop = threading.Event()
+        # Set to make the watcher re-probe now instead of after its backoff.
+        self._music_watch_wake = threading.Event()
         self._music_watch_thread = None
 
         # Server status gating
-        self._status_cache_value = None
-        self._status_cache_at = 0.0
-        self._status_cache_ttl = 1.0
         self._last_status_mode_print_at = 0.0
         self._last_status_mode_value = None
 
-        self._status_lock = threading.Lock()
+        # Written only by the status watcher (a plain reference swap), read
+        # lock-free by get_server_status().
         self._status_value = None
         self._status_change_event = threading.Event()
         self._status_watch_stop = threading.Event()
+        self._status_watch_wake = threading.Event()
         self._status_watch_thread = None
+        self.status_watch_interval = float(status_watch_interval)
+        # The idle music watcher backs off from its base interval up to this
+        # cap. The status watcher never does: it is the kill switch.
+        self.max_watch_interval = float(max_watch_interval)
 
-        self.debug_tts = os.getenv("DEBUG_TTS", "0").strip() in {"1", "true", "True", "yes", "YES"}
+        self.debug_tts = os.getenv("DEBUG_TTS", "0").strip() in _TRUTHY
 
         # Music volume (Windows/ffplay only). Used to duck music under AI alerts.
         self.music_volume_normal = 100
@@ -114,7 +201,24 @@ class FMClient:
         self.tts_gain_user = 4.0
         self.tts_gain_ai = 4.0
 
-        self._validate_state()
+        # ffplay process of the utterance being spoken, so other threads can cut it off.
+        self._tts_proc_lock = threading.Lock()
+        self._tts_proc = None
+        self._tts_cancelled = False
+
+        # Disk cache of rendered alert audio (disabled when no directory is given).
+        self.tts_cache = None
+        if tts_cache_dir:
+            try:
+                self.tts_cache = TTSCache(tts_cache_dir)
+            except OSError as e:
+                print(f"⚠️  TTS cache disabled ({tts_cache_dir}): {e}")
+
+        self.start_state_writer()
+        # The DB round-trip of the state check shouldn't hold up construction;
+        # run() waits for it before the state is first used.
+        self._validate_thread = threading.Thread(target=self._validate_state, name="state-validate", daemon=True)
+        self._validate_thread.start()
         # Start background monitor to reset client_state.json alert ids after 5s
         self.start_client_state_reset_monitor(state_path=self.state_path)
 
@@ -125,6 +229,12 @@ class FMClient:
         with self._music_lock:
             self._desired_music = music
             self._music_change_event.set()
+        self._wakeup.set()
+
+    def _wait_for_wakeup(self, timeout: float) -> None:
+        if timeout > 0:
+            self._wakeup.wait(timeout)
+        self._wakeup.clear()
 
     def _get_desired_music(self):
         with self._music_lock:
@@ -133,9 +243,15 @@ class FMClient:
     def _consume_music_change(self):
         if not self._music_change_event.is_set():
             return None
-        with self._music_lock:
+        # Only contended while the watcher is publishing a row; it sets _wakeup
+        # right after releasing the lock, so the next pass picks the change up.
+        if not self._music_lock.acquire(blocking=False):
+            return None
+        try:
             self._music_change_event.clear()
             return self._desired_music
+        finally:
+            self._music_lock.release()
 
     @staticmethod
     def _same_music(a, b) -> bool:
@@ -143,7 +259,8 @@ class FMClient:
             return True
         if a is None or b is None:
             return False
-        return (str(a.link or "").strip() == str(b.link or "").strip()) and (int(a.id) == int(b.id))
+        # Rows come from MySQLRadioDB, so id is an int and link a str already.
+        return a.id == b.id and a.link.strip() == b.link.strip()
 
     def start_music_watcher(self) -> None:
         if self.music_id <= 0:
@@ -155,31 +272,47 @@ class FMClient:
 
         def _watch():
             last_link = None
+            backoff = _AdaptiveInterval(self.music_watch_interval, self.max_watch_interval)
             while not self._music_watch_stop.is_set():
+                changed = False
                 try:
-                    row = self.db.get_music_by_id(self.music_id)
-                    link = (row.link if row else "")
-                    link = str(link or "").strip()
-
-                    # On first successful read, seed desired music.
-                    if row and link and last_link is None:
-                        last_link = link
-                        self._set_desired_music(row)
-                    # On changes, signal the playback loop.
-                    elif row and link and link != (last_link or ""):
-                        last_link = link
-                        self._set_desired_music(row)
+                    # Probe only the link; fetch the full row when it changed.
+                    probe = (self.db.get_music_link(self.music_id) or "").strip()
+                    if probe and probe != last_link:
+                        row = self.db.get_music_by_id(self.music_id)
+                        link = row.link.strip() if row else ""
+
+                        # On first successful read, seed desired music.
+                        if row and link and last_link is None:
+                            last_link = link
+                            self._set_desired_music(row)
+                            changed = True
+                        # On changes, signal the playback loop.
+                        elif row and link and link != (last_link or ""):
+                            last_link = link
+                            self._set_desired_music(row)
+                            changed = True
                 except Exception:
                     # Best-effort watcher: DB hiccups shouldn't crash playback.
                     pass
 
-                time.sleep(max(0.2, float(self.music_watch_interval)))
+                self._music_watch_wake.wait(backoff.next(changed))
+                if self._music_watch_wake.is_set():
+                    self._music_watch_wake.clear()
+                    backoff.next(True)
 
         self._music_watch_thread = threading.Thread(target=_watch, name="music-db-watcher", daemon=True)
         self._music_watch_thread.start()
 
+    def wake_watchers(self) -> None:
+        """Make both DB watchers re-check now; the music watcher drops back to its base interval."""
+        self._music_watch_wake.set()
+        self._status_watch_wake.set()
+
     def stop_music_watcher(self) -> None:
         self._music_watch_stop.set()
+        # Cut the backoff wait short so join() returns right away.
+        self._music_watch_wake.set()
         t = self._music_watch_thread
         if t and t.is_alive():
             try:
@@ -187,27 +320,62 @@ class FMClient:
             except Exception:
                 pass
 
+    # ---------------------------
+    # State persistence
+    # ---------------------------
+    def _mark_state_dirty(self) -> None:
+        self._state_dirty.set()
+
+    def flush_state(self) -> None:
+        """Write the state file now if there are unsaved changes."""
+        with self._state_write_lock:
+            if not self._state_dirty.is_set():
+                return
+            self._state_dirty.clear()
+            try:
+                save_state(self.state_path, self.state)
+            except OSError as e:
+                print(f"⚠️  Could not save state to {self.state_path}: {e}")
+                self._state_dirty.set()
+
+    def start_state_writer(self) -> None:
+        def _write():
+            while True:
+                self._state_dirty.wait()
+                # Let a burst of changes (ack + next alert + track end) settle.
+                time.sleep(self.state_flush_interval)
+                self.flush_state()
+
+        threading.Thread(target=_write, name="state-writer", daemon=True).start()
+        # The writer is a daemon thread; don't lose a pending change on exit.
+        atexit.register(self.flush_state)
+
     # ---------------------------
     # Internal helpers
     # ---------------------------
     def _validate_state(self):
         try:
             max_music_id = self.db.get_music_max_id()
-            if int(self.state.last_music_id) > int(max_music_id):
+            if self.state.last_music_id > max_music_id:
                 print(
                     f"⚠️ Local state last_music_id={self.state.last_music_id} "
                     f"is ahead of DB max id={max_music_id}. Resetting."
                 )
                 self.state.last_music_id = 0
                 self.state.last_music_link = ""
-                save_state(self.state_path, self.state)
+                self._mark_state_dirty()
         except Exception:
             pass
 
     @staticmethod
     def _split_message(msg: str) -> list[str]:
         raw = str(msg or "")
-        parts = [p.strip() for p in re.split(r"\|+|\n+", raw) if p.strip()]
+        if "|" not in raw and "\n" not in raw:
+            # Single-part message (the usual case): nothing to split.
+            single = raw.strip()
+            return [single] if single else []
+        # Strip each part once, then drop the empty ones.
+        parts = [p for p in (p.strip() for p in _SPLIT_RE.split(raw)) if p]
         if parts:
             return parts
         single = raw.strip()
@@ -217,16 +385,21 @@ class FMClient:
     # TTS
     # ---------------------------
     def start_client_state_monitor(self, state_path=None, poll_interval=1.0):
-        import threading, json, time, os
+        import threading, time, os
         if state_path is None:
             state_path = os.path.join(os.path.dirname(__file__), '..', 'client_state.json')
         state_path = os.path.abspath(state_path)
         def monitor():
             last_seen = {"last_ai_alert_id": None, "last_user_alert_id": None}
+            last_mtime = None
             while True:
                 try:
-                    with open(state_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
+                    mtime = os.stat(state_path).st_mtime_ns
+                    if mtime == last_mtime:
+                        time.sleep(poll_interval)
+                        continue
+                    last_mtime = mtime
+                    data = read_json(state_path)
                     changed = False
                     for key in ("last_ai_alert_id", "last_user_alert_id"):
                         val = data.get(key, 0)
@@ -235,52 +408,78 @@ class FMClient:
                             changed = True
                         last_seen[key] = data.get(key, 0)
                     if changed:
-                        with open(state_path, 'w', encoding='utf-8') as f:
-                            json.dump(data, f, indent=2)
+                        write_json(state_path, data)
                 except Exception as e:
                     print(f"[client_state monitor] Error: {e}")
                 time.sleep(poll_interval)
         t = threading.Thread(target=monitor, daemon=True)
         t.start()
-    @staticmethod
-    def _play_audio_file_ffplay(file_path: str, *, volume: int = 100, gain: float = 1.0) -> None:
-        vol = int(volume)
-        if vol < 0:
-            vol = 0
-        if vol > 100:
-            vol = 100
-
-        cmd = [
-            "ffplay",
-            "-nodisp",
-            "-autoexit",
-            "-loglevel",
-            "error",
-            "-volume",
-            str(vol),
-        ]
-        if gain and float(gain) != 1.0:
-            cmd.extend(["-af", f"volume={float(gain)}"])
-        import os
-        cmd.append(str(file_path))
-
-        if not os.path.isfile(file_path):
-            raise FileNotFoundError(f"Audio file not found: {file_path}")
-
-        proc = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    def _play_audio_file_ffplay(
+        self,
+        file_path: str,
+        *,
+        volume: int = 100,
+        gain: float = 1.0,
+        audio_bytes: bytes | None = None,
+    ) -> None:
+        """Play an audio file, or `audio_bytes` piped to ffplay's stdin."""
+        cmd = list(_ffplay_tts_argv(self.player.ffplay, int(volume), float(gain or 1.0), audio_bytes is not None))
+        if audio_bytes is None:
+            # A missing file is reported by ffplay's exit status and stderr.
+            cmd.append(str(file_path))
+
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if audio_bytes is not None else subprocess.DEVNULL,
+            # ffplay writes nothing useful to stdout; with -loglevel error the
+            # stderr pipe only carries the failure reason.
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        with self._tts_proc_lock:
+            self._tts_proc = proc
+        try:
+            _, err = proc.communicate(input=audio_bytes)
+        finally:
+            with self._tts_proc_lock:
+                self._tts_proc = None
+                cancelled = self._tts_cancelled
+                self._tts_cancelled = False
+        if cancelled:
+            raise TTSCancelled("TTS playback cancelled")
         if proc.returncode != 0:
-            details = (proc.stderr or proc.stdout or "").strip()
+            details = (err or b"").decode("utf-8", "replace").strip()
             print(f"❌ ffplay failed to play audio: {details}")
             raise RuntimeError(f"ffplay failed to play audio: {details}" if details else "ffplay failed to play audio")
 
+    def cancel_current_tts(self) -> None:
+        """Stop the utterance being played (if any); its speak call raises `TTSCancelled`."""
+        with self._tts_proc_lock:
+            proc = self._tts_proc
+            if proc is None or proc.poll() is not None:
+                return
+            self._tts_cancelled = True
+        try:
+            proc.terminate()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _read_bytes(path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
     @staticmethod
     def _has_speakable_text(msg: str) -> bool:
         # Mirror `tts.generate_voice_from_text` cleaning logic enough to decide if this is empty.
         s = " ".join(str(msg or "").strip().split())
         if not s:
             return False
+        if s.isascii():
+            # The markers below are all non-ASCII.
+            return True
         # Remove common invisible/control markers.
-        s = re.sub(r"[\u200b-\u200f\u202a-\u202e]", "", s)
+        s = _CTRL_RE.sub("", s)
         return bool(s.strip())
 
     @staticmethod
@@ -293,48 +492,96 @@ class FMClient:
         )
 
     def speak_message(self, msg: str, *, gain: float = 1.0) -> int:
-        import os
+        """Speak `msg`; returns the number of parts played.
+
+        Raises `TTSCancelled` when the radio is off or playback is cut off
+        partway, so callers don't acknowledge an alert that wasn't heard.
+        """
         if not self.is_audio_allowed():
             self._print_status_mode_once()
-            return 0
+            raise TTSCancelled("radio is switched off")
         if self.debug_tts:
             raw = str(msg or "")
             print(f"🧪 TTS raw len={len(raw)} repr={raw!r}")
-        spoken = 0
+        clips = []
         for part in self._split_message(msg):
             if not self._has_speakable_text(part):
                 continue
 
+            lang = detect_language(part)
             if self.debug_tts:
-                p = str(part)
-                print(f"🧪 TTS part len={len(p)} lang={detect_language(p)} repr={p!r}")
+                print(f"🧪 TTS part len={len(part)} lang={lang} repr={part!r}")
 
             try:
-                lang = detect_language(part)
-                audio = generate_voice_from_text(part, lang=lang)
+                # Without a disk cache the MP3 stays in memory and is piped to ffplay.
+                audio = generate_voice_from_text(
+                    part, lang=lang, cache=self.tts_cache, in_memory=self.tts_cache is None
+                )
             except Exception as e:
                 print(f"❌ TTS generation failed for a message part: {e}")
                 continue
 
             audio_file = audio.get("file")
+            audio_bytes = audio.get("bytes")
             print(
                 f"🔊 Speaking ({audio.get('lang')}) via {audio.get('engine')} "
-                f"voice={audio.get('voice', 'N/A')} rate={audio.get('rate', 'N/A')} file={audio_file}"
+                f"voice={audio.get('voice', 'N/A')} rate={audio.get('rate', 'N/A')} "
+                f"file={audio_file or '<memory>'}"
             )
 
-            if not audio_file or not os.path.isfile(audio_file):
+            # The file was just written (or found) by generate_voice_from_text().
+            if audio_bytes is None and not audio_file:
                 print(f"❌ TTS audio file does not exist: {audio_file}")
                 continue
 
+            clips.append((audio_file, audio_bytes))
+
+        if len(clips) > 1:
+            # MP3 frames concatenate cleanly, so a multi-part message is played
+            # by one ffplay instead of one process per part.
+            try:
+                joined = b"".join(b if b is not None else self._read_bytes(f) for f, b in clips)
+            except OSError as e:
+                print(f"❌ Could not read TTS audio: {e}")
+            else:
+                try:
+                    self._play_audio_file_ffplay("", volume=100, gain=gain, audio_bytes=joined)
+                except FileNotFoundError:
+                    pass  # No ffplay: play the parts one by one below.
+                except TTSCancelled:
+                    raise
+                except Exception as e:
+                    print(f"❌ Exception during TTS playback: {e}")
+                    return 0
+                else:
+                    return len(clips)
+
+        spoken = 0
+        for audio_file, audio_bytes in clips:
+            if not self.is_audio_allowed():
+                # Radio was switched off mid-message (see cancel_current_tts()).
+                raise TTSCancelled("radio switched off mid-message")
             try:
-                self._play_audio_file_ffplay(audio_file, volume=100, gain=float(gain))
+                self._play_audio_file_ffplay(audio_file, volume=100, gain=gain, audio_bytes=audio_bytes)
             except FileNotFoundError:
-                print(f"❌ ffplay not found, falling back to playsound for {audio_file}")
+                print(f"❌ ffplay not found, falling back to playsound for {audio_file or '<memory>'}")
                 try:
                     from playsound import playsound
-                    playsound(audio_file)
+                    if audio_bytes is None:
+                        playsound(audio_file)
+                    else:
+                        # playsound needs a real file. It is closed before playing
+                        # (Windows can't open it twice) and removed afterwards.
+                        with tempfile.NamedTemporaryFile(prefix="alert_", suffix=".mp3", delete=False) as f:
+                            f.write(audio_bytes)
+                        try:
+                            playsound(f.name)
+                        finally:
+                            os.remove(f.name)
                 except Exception as e2:
                     print(f"❌ playsound failed: {e2}")
+            except TTSCancelled:
+                raise
             except Exception as e:
                 print(f"❌ Exception during TTS playback: {e}")
             else:
@@ -346,33 +593,25 @@ class FMClient:
     # Server status gating
     # ---------------------------
     def get_server_status(self) -> str:
-        with self._status_lock:
-            if self._status_value is not None:
-                return str(self._status_value or "")
+        status = self._status_value
+        if status is not None:
+            return status
 
-        now = time.time()
-        if (now - float(self._status_cache_at)) < float(self._status_cache_ttl):
-            return str(self._status_cache_value or "")
-
-        status = ""
+        # Watcher not started (or not through its first read) yet.
         try:
-            status = self.db.get_server_status() or ""
+            return self.db.get_server_status() or ""
         except Exception:
-            status = ""
-
-        self._status_cache_value = status
-        self._status_cache_at = now
-        return str(status or "")
+            return ""
 
     def is_audio_allowed(self) -> bool:
-        status = (self.get_server_status() or "").strip().lower()
-        return status in {"net", "both"}
+        # get_server_status() always returns a normalized string.
+        return self.get_server_status() in _AUDIO_STATUSES
 
     def _print_status_mode_once(self) -> None:
-        status = (self.get_server_status() or "").strip().lower()
-        now = time.time()
+        status = self.get_server_status()
+        now = time.monotonic()
         # Print only when status changes or every ~15 seconds.
-        if status != self._last_status_mode_value or (now - float(self._last_status_mode_print_at)) > 15.0:
+        if status != self._last_status_mode_value or (now - self._last_status_mode_print_at) > 15.0:
             self._last_status_mode_value = status
             self._last_status_mode_print_at = now
             shown = status if status else "<unknown>"
@@ -389,48 +628,53 @@ class FMClient:
             last_print = 0.0
             while not self._status_watch_stop.is_set():
                 try:
-                    current = self.db.get_server_status() or ""
-                    current = str(current or "").strip().lower()
+                    # Already stripped and lower-cased by MySQLRadioDB. Always
+                    # read fresh; the watcher is what other callers rely on.
+                    current = self.db.get_server_status(max_age=0) or ""
                 except Exception:
                     current = ""
 
                 if last is None:
                     last = current
-                    with self._status_lock:
-                        self._status_value = current
+                    self._status_value = current
                     print(f"📡 Server status: {current!r}")
-                    last_print = time.time()
+                    last_print = time.monotonic()
                 elif current != last:
                     old = last
                     last = current
-                    with self._status_lock:
-                        self._status_value = current
+                    self._status_value = current
                     self._status_change_event.set()
+                    self._wakeup.set()
                     print(f"🔄 Server status changed: {old!r} -> {current!r}")
 
-                    last_print = time.time()
+                    last_print = time.monotonic()
 
                     # Immediate action on disable.
-                    if current not in {"net", "both"}:
+                    if current not in _AUDIO_STATUSES:
                         try:
                             self.player.stop()
                         except Exception:
                             pass
+                        self.cancel_current_tts()
                         self._print_status_mode_once()
 
                 # Periodic status line (helps when status never changes)
-                now = time.time()
-                if (now - float(last_print)) > 30.0:
+                now = time.monotonic()
+                if (now - last_print) > 30.0:
                     print(f"📡 Server status: {last!r}")
                     last_print = now
 
-                time.sleep(max(0.2, float(interval)))
+                # Fixed interval: turning the radio off must stop playback within
+                # `interval`, however long the status has been unchanged.
+                self._status_watch_wake.wait(interval)
+                self._status_watch_wake.clear()
 
         self._status_watch_thread = threading.Thread(target=_watch, name="status-db-watcher", daemon=True)
         self._status_watch_thread.start()
 
     def stop_status_watcher(self) -> None:
         self._status_watch_stop.set()
+        self._status_watch_wake.set()
         t = self._status_watch_thread
         if t and t.is_alive():
             try:
@@ -441,70 +685,151 @@ class FMClient:
     # ---------------------------
     # Alert handling
     # ---------------------------
-    def handle_user_alerts(self):
+    @staticmethod
+    def _is_fixed_alert(alert) -> bool:
+        # The id=1 rows are overwritten in place and always take priority.
+        return bool(alert and alert.id == 1 and alert.message and alert.message.strip())
+
+    def _process_user_alert(self, alert) -> None:
+        print(f"📥 User alert (id={alert.id})")
+        try:
+            self.speak_message(alert.message, gain=self.tts_gain_user)
+        except TTSCancelled as e:
+            # Cut off, or the radio is off: leave it for the next poll.
+            print(f"❌ User alert interrupted: {e}")
+            return
+        except Exception as e:
+            print(f"❌ Failed to speak user alert: {e}")
+            return
+        # Acknowledged even if nothing could be played (TTS or ffplay failure);
+        # retrying would restart the music on every poll.
+        removed = self.db.ack_user_alert(alert.id)
+        if not removed:
+            print(f"⚠️  Could not remove user alert from DB (id={alert.id})")
+
+    def _process_ai_alert(self, alert, *, track_id: bool) -> bool:
+        """Speak and acknowledge an AI alert; returns True if it was spoken.
+
+        With `track_id`, the alert id is recorded in the local state once the
+        alert is done with (spoken, or acknowledged as unspeakable).
+        """
+        print(f"🚨 AI alert (id={alert.id}, severity={alert.severity})")
+        try:
+            spoken = self.speak_message(alert.message, gain=self.tts_gain_ai)
+        except TTSCancelled as e:
+            # Cut off, or the radio is off: leave it unacknowledged so it is played again.
+            print(f"❌ AI alert interrupted: {e}")
+            return False
+        except Exception as e:
+            print(f"❌ Failed to speak AI alert: {e}")
+            # If the alert has no usable text, acknowledge it anyway to avoid retry loops.
+            if (not self._has_speakable_text(alert.message)) or self._should_ack_failed_tts(e):
+                self._ack_ai_alert(alert, track_id=track_id)
+            return False
+        if spoken <= 0:
+            # Nothing played (no speakable text, TTS or ffplay failure). Acknowledge
+            # it anyway: a retry would duck the music on every poll and hold back
+            # every later queued alert.
+            print(f"⚠️  AI alert not spoken; acknowledging it (id={alert.id})")
+            self._ack_ai_alert(alert, track_id=track_id)
+            return False
+        self._ack_ai_alert(alert, track_id=track_id)
+        return True
+
+    def _ack_ai_alert(self, alert, *, track_id: bool) -> None:
+        removed = self.db.ack_ai_alert(alert.id)
+        if not removed:
+            print(f"⚠️  Could not remove AI alert from DB (id={alert.id})")
+        if track_id:
+            self.state.last_ai_alert_id = alert.id
+            self._mark_state_dirty()
+
+    def _pause_for_user_alert(self, music, position: float, alert) -> float:
+        """Stop the music, speak `alert`, resume; returns the resume position."""
+        self.player.stop()
+        self._process_user_alert(alert)
+        # Resume music from last position (after alert)
+        self.player.start(music.link, volume=self.music_volume_normal, position=position)
+        return position
+
+    def _duck_for_ai_alert(self, music, position: float, alert, *, track_id: bool) -> float:
+        """Play `alert` over ducked music; returns the position music resumed at."""
+        # Reduce volume in place through PulseAudio when possible; otherwise
+        # restart ffplay with lower volume. ffplay can't change volume itself,
+        # so each restart seeks to where the track actually is instead of
+        # jumping back to the last resume point.
+        ducked_at = time.monotonic()
+        in_place = self.player.set_volume(self.music_volume_ducked)
+        if not in_place:
+            self.player.start(music.link, volume=self.music_volume_ducked, position=position)
+        try:
+            self._process_ai_alert(alert, track_id=track_id)
+        finally:
+            # Restore normal music volume (best-effort)
+            position += time.monotonic() - ducked_at
+            if not (in_place and self.player.set_volume(self.music_volume_normal)):
+                self.player.start(music.link, volume=self.music_volume_normal, position=position)
+        return position
+
+    def handle_user_alerts(self, poll=None):
         # Always check for user alert at id=1
-        user_alert = self.db.get_next_user_alert_after(0)
-        if user_alert and user_alert.id == 1 and user_alert.message and user_alert.message.strip():
-            print(f"📥 User alert (id=1)")
-            try:
-                self.speak_message(user_alert.message, gain=self.tts_gain_user)
-            except Exception as e:
-                print(f"❌ Failed to speak user alert: {e}")
-            else:
-                removed = self.db.ack_user_alert(user_alert.id)
-                if not removed:
-                    print(f"⚠️  Could not remove user alert from DB (id=1)")
+        user_alert = poll.user_alert if poll else self.db.get_next_user_alert_after(0)
+        if self._is_fixed_alert(user_alert):
+            self._process_user_alert(user_alert)
             return True
         # Always check for AI alert at id=1
-        ai_alert = self.db.get_next_ai_alert_after(0)
-        if ai_alert and ai_alert.id == 1 and ai_alert.message and ai_alert.message.strip():
-            print(f"🚨 AI alert (id=1, severity={ai_alert.severity})")
-            try:
-                spoken = self.speak_message(ai_alert.message, gain=self.tts_gain_ai)
-                if spoken <= 0:
-                    raise ValueError("AI alert has no speakable text")
-            except Exception as e:
-                print(f"❌ Failed to speak AI alert: {e}")
-                if (not self._has_speakable_text(ai_alert.message)) or self._should_ack_failed_tts(e):
-                    removed = self.db.ack_ai_alert(ai_alert.id)
-                    if not removed:
-                        print(f"⚠️  Could not remove AI alert from DB (id=1)")
-            else:
-                removed = self.db.ack_ai_alert(ai_alert.id)
-                if not removed:
-                    print(f"⚠️  Could not remove AI alert from DB (id=1)")
+        ai_alert = poll.ai_fixed if poll else self.db.get_next_ai_alert_after(0)
+        if self._is_fixed_alert(ai_alert):
+            self._process_ai_alert(ai_alert, track_id=False)
             return True
         return False
 
-    def handle_ai_alerts(self):
-        ai_alert = self.db.get_next_ai_alert_after(self.state.last_ai_alert_id)
+    def handle_ai_alerts(self, poll=None):
+        if poll:
+            ai_alert = poll.ai_alert
+        else:
+            ai_alert = self.db.get_next_ai_alert_after(self.state.last_ai_alert_id)
         if ai_alert and ai_alert.id > 0:
-            print(f"🚨 AI alert (id={ai_alert.id}, severity={ai_alert.severity})")
-            try:
-                spoken = self.speak_message(ai_alert.message, gain=self.tts_gain_ai)
-                if spoken <= 0:
-                    raise ValueError("AI alert has no speakable text")
-            except Exception as e:
-                print(f"❌ Failed to speak AI alert: {e}")
-                # If the alert has no usable text, acknowledge it anyway to avoid retry loops.
-                if (not self._has_speakable_text(ai_alert.message)) or self._should_ack_failed_tts(e):
-                    removed = self.db.ack_ai_alert(ai_alert.id)
-                    if not removed:
-                        print(f"⚠️  Could not remove AI alert from DB (id={ai_alert.id})")
-                    self.state.last_ai_alert_id = ai_alert.id
-                    save_state(self.state_path, self.state)
-            else:
-                removed = self.db.ack_ai_alert(ai_alert.id)
-                if not removed:
-                    print(f"⚠️  Could not remove AI alert from DB (id={ai_alert.id})")
-                self.state.last_ai_alert_id = ai_alert.id
-                save_state(self.state_path, self.state)
-                return True
+            return self._process_ai_alert(ai_alert, track_id=True)
         return False
 
     # ---------------------------
     # Music handling
     # ---------------------------
+    def _probe_duration(self, link: str):
+        """yt-dlp duration of `link`, remembered per link once known.
+
+        Failed probes and live streams (None) are not cached, so they are
+        retried the next time the link plays.
+        """
+        d = self._duration_cache.get(link)
+        if d is None:
+            d = get_media_duration_seconds(link)
+            if d is not None:
+                if len(self._duration_cache) >= 256:
+                    # Drop the oldest entry (dicts keep insertion order).
+                    self._duration_cache.pop(next(iter(self._duration_cache)), None)
+                self._duration_cache[link] = d
+        return d
+
+    def _prefetch_next_music(self, current_id: int) -> None:
+        """Warm the stream URL and duration caches for the track after `current_id`.
+
+        Only sequential mode knows its next track ahead of time; in fixed-row
+        mode the next track is whatever the DB row changes to.
+        """
+        if self.music_id > 0:
+            return
+        try:
+            nxt = self.db.get_next_music_after(current_id)
+        except Exception:
+            return
+        if not nxt or not nxt.link:
+            return
+        self.player.prefetch(nxt.link)
+        if nxt.duration_seconds is None:
+            self._probe_duration(nxt.link)
+
     def get_next_music(self):
         music = self.db.get_next_music_after(self.state.last_music_id)
         if not music:
@@ -524,29 +849,45 @@ class FMClient:
         def _resolve_duration(m):
             d = m.duration_seconds
             if d is None:
-                d = get_media_duration_seconds(m.link)
+                d = self._probe_duration(m.link)
             if d is None and self.music_id <= 0:
-                d = int(self.default_duration)
+                d = self.default_duration
             return d
 
-        duration = _resolve_duration(music)
+        # The yt-dlp duration probe can take seconds; run it next to playback
+        # instead of in front of it.
+        duration_future = self._executor.submit(_resolve_duration, music)
+        duration_future.add_done_callback(lambda _f: self._wakeup.set())
 
         print(f"🎶 Playing music (id={music.id}) {music.name}")
         print(f"🔗 {music.link}")
-        print(f"⏳ Duration: {duration}s" if duration is not None else "⏳ Duration: (continuous)")
 
         resume_position = 0.0
         # Only start player if not already playing this music
         if not hasattr(self, '_current_music') or not self._same_music(self._current_music, music):
             self.player.start(music.link, volume=self.music_volume_normal, position=resume_position)
             self._current_music = music
-            started_at = time.time()
+            started_at = time.monotonic()
         else:
             # Continue from current position
-            started_at = time.time() - resume_position
-        planned = int(duration) if duration is not None else None
+            started_at = time.monotonic() - resume_position
+        planned = None
+        last_alert_check = 0.0
+        prefetched = False
 
         while True:
+            # One clock read per pass; monotonic so wall-clock adjustments can't
+            # end a track early or stall the alert cadence.
+            now = time.monotonic()
+            if duration_future is not None and duration_future.done():
+                try:
+                    duration = duration_future.result()
+                except Exception:
+                    duration = None
+                duration_future = None
+                print(f"⏳ Duration: {duration}s" if duration is not None else "⏳ Duration: (continuous)")
+                planned = int(duration) if duration is not None else None
+
             if not self.is_audio_allowed():
                 self._print_status_mode_once()
                 try:
@@ -561,101 +902,63 @@ class FMClient:
             if desired and (not self._same_music(desired, music)) and desired.link:
                 print(f"🔁 DB music changed (id={desired.id}) switching")
                 music = desired
-                duration = _resolve_duration(music)
+                if duration_future is not None:
+                    duration_future.cancel()
+                duration_future = self._executor.submit(_resolve_duration, music)
+                duration_future.add_done_callback(lambda _f: self._wakeup.set())
                 print(f"🎶 Playing music (id={music.id}) {music.name}")
                 print(f"🔗 {music.link}")
-                print(f"⏳ Duration: {duration}s" if duration is not None else "⏳ Duration: (continuous)")
                 resume_position = 0.0
                 self.player.start(music.link, volume=self.music_volume_normal, position=resume_position)
                 self._current_music = music
-                started_at = time.time()
-                planned = int(duration) if duration is not None else None
+                started_at = time.monotonic()
+                planned = None
+                prefetched = False
 
-            elapsed = time.time() - started_at + resume_position
+            elapsed = now - started_at + resume_position
             if planned is not None and elapsed >= planned:
                 self.player.stop()
                 break
-
-            # Interrupt for user alerts
-            # Always check for user alert at id=1
-            user_alert = self.db.get_next_user_alert_after(0)
-            if user_alert and user_alert.id == 1 and user_alert.message and user_alert.message.strip():
-                print(f"📥 User alert (id=1)")
-                self.player.stop()
-                # Calculate resume position
-                resume_position = time.time() - started_at + resume_position
-
-                try:
-                    self.speak_message(user_alert.message, gain=self.tts_gain_user)
-                except Exception as e:
-                    print(f"❌ Failed to speak user alert: {e}")
-                else:
-                    removed = self.db.ack_user_alert(user_alert.id)
-                    if not removed:
-                        print(f"⚠️  Could not remove user alert from DB (id=1)")
-
-                # Resume music from last position (after alert)
-                self.player.start(music.link, volume=self.music_volume_normal, position=resume_position)
-                started_at = time.time()
-
-            # Always check for AI alert at id=1
-            ai_alert = self.db.get_next_ai_alert_after(0)
-            if ai_alert and ai_alert.id == 1 and ai_alert.message and ai_alert.message.strip():
-                print(f"🚨 AI alert (id=1, severity={ai_alert.severity})")
-                self.player.start(music.link, volume=self.music_volume_ducked, position=resume_position)
-                try:
-                    spoken = self.speak_message(ai_alert.message, gain=self.tts_gain_ai)
-                    if spoken <= 0:
-                        raise ValueError("AI alert has no speakable text")
-                except Exception as e:
-                    print(f"❌ Failed to speak AI alert: {e}")
-                    if (not self._has_speakable_text(ai_alert.message)) or self._should_ack_failed_tts(e):
-                        removed = self.db.ack_ai_alert(ai_alert.id)
-                        if not removed:
-                            print(f"⚠️  Could not remove AI alert from DB (id=1)")
-                else:
-                    removed = self.db.ack_ai_alert(ai_alert.id)
-                    if not removed:
-                        print(f"⚠️  Could not remove AI alert from DB (id=1)")
-                finally:
-                    # Restore normal music volume (best-effort)
-                    self.player.start(music.link, volume=self.music_volume_normal, position=resume_position)
-                started_at = time.time()
-
-            # Duck music for AI alerts (do not pause)
-            ai_alert = self.db.get_next_ai_alert_after(self.state.last_ai_alert_id)
-            if ai_alert and ai_alert.id > 0:
-                print(f"🚨 AI alert (id={ai_alert.id}, severity={ai_alert.severity})")
-
-                # Reduce volume (best-effort: restart ffplay with lower volume)
-                self.player.start(music.link, volume=self.music_volume_ducked, position=resume_position)
-                try:
-                    spoken = self.speak_message(ai_alert.message, gain=self.tts_gain_ai)
-                    if spoken <= 0:
-                        raise ValueError("AI alert has no speakable text")
-                except Exception as e:
-                    print(f"❌ Failed to speak AI alert: {e}")
-                    if (not self._has_speakable_text(ai_alert.message)) or self._should_ack_failed_tts(e):
-                        removed = self.db.ack_ai_alert(ai_alert.id)
-                        if not removed:
-                            print(f"⚠️  Could not remove AI alert from DB (id={ai_alert.id})")
-                        self.state.last_ai_alert_id = ai_alert.id
-                        save_state(self.state_path, self.state)
-                else:
-                    removed = self.db.ack_ai_alert(ai_alert.id)
-                    if not removed:
-                        print(f"⚠️  Could not remove AI alert from DB (id={ai_alert.id})")
-                    self.state.last_ai_alert_id = ai_alert.id
-                    save_state(self.state_path, self.state)
-                finally:
-                    # Restore normal music volume (best-effort)
-                    self.player.start(music.link, volume=self.music_volume_normal, position=resume_position)
-
-            time.sleep(0.5)
+            if planned is not None and not prefetched and planned - elapsed < 10:
+                # Resolve the next track while this one plays out.
+                prefetched = True
+                self._executor.submit(self._prefetch_next_music, music.id)
+
+            # Alerts are polled on their own cadence; between checks only the
+            # cheap in-memory status/music-change checks above run.
+            next_check = last_alert_check + self.alert_check_interval
+            if now < next_check:
+                deadline = next_check
+                if planned is not None:
+                    deadline = min(deadline, started_at - resume_position + planned)
+                self._wait_for_wakeup(deadline - now)
+                continue
+            last_alert_check = now
+
+            # One round-trip for all alert tables; at most one alert is handled
+            # per check so the next check sees fresh rows.
+            poll = self.db.poll_alerts(self.state.last_ai_alert_id)
+
+            # Interrupt for user alerts (id=1), otherwise duck music for an AI
+            # alert at id=1, then for queued AI alerts.
+            position = time.monotonic() - started_at + resume_position
+            if self._is_fixed_alert(poll.user_alert):
+                resume_position = self._pause_for_user_alert(music, position, poll.user_alert)
+            elif self._is_fixed_alert(poll.ai_fixed):
+                resume_position = self._duck_for_ai_alert(music, position, poll.ai_fixed, track_id=False)
+            elif poll.ai_alert and poll.ai_alert.id > 0:
+                resume_position = self._duck_for_ai_alert(music, position, poll.ai_alert, track_id=True)
+            else:
+                continue
+            # The player was restarted at resume_position; restart the track clock.
+            started_at = time.monotonic()
 
         self.state.last_music_id = music.id
         self.state.last_music_link = music.link
-        save_state(self.state_path, self.state)
+        self._mark_state_dirty()
+        # The track ran out: the music watcher may be deep in backoff, so have
+        # it look for the next one right away.
+        self.wake_watchers()
 
     # ---------------------------
     # Main loop
@@ -664,7 +967,8 @@ class FMClient:
         print("🛰️ Client connected (polling MySQL)")
         try:
             self.start_music_watcher()
-            self.start_status_watcher()
+            self.start_status_watcher(interval=self.status_watch_interval)
+            self._validate_thread.join()
             while True:
                 if not self.is_audio_allowed():
                     self._print_status_mode_once()
@@ -672,11 +976,15 @@ class FMClient:
                         self.player.stop()
                     except Exception:
                         pass
-                    time.sleep(int(self.poll_interval))
+                    # Nothing to do until the status watcher reports a change; the
+                    # timeout only guards against a watcher that died.
+                    self._status_change_event.wait(timeout=max(self.poll_interval, 60.0))
+                    self._status_change_event.clear()
                     continue
 
-                self.handle_user_alerts()
-                self.handle_ai_alerts()
+                poll = self.db.poll_alerts(self.state.last_ai_alert_id)
+                if not self.handle_user_alerts(poll):
+                    self.handle_ai_alerts(poll)
 
                 # Prefer fixed-row mode (id=1) when enabled; fallback to sequential mode.
                 music = None
@@ -690,9 +998,11 @@ class FMClient:
                     except Exception as e:
                         print(f"❌ Playback error: {e}")
 
-                time.sleep(int(self.poll_interval))
+                # Woken early when the music row or server status changes.
+                self._wait_for_wakeup(self.poll_interval)
         except KeyboardInterrupt:
             print("\n🛑 Client stopped")
+            self.flush_state()
             try:
                 self.player.stop()
             except Exception:
@@ -705,3 +1015,4 @@ class FMClient:
                 self.stop_status_watcher()
             except Exception:
                 pass
+            self._executor.shutdown(wait=False)
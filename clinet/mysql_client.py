@@ -1,13 +1,67 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from typing import Optional
 
 import mysql.connector
 from mysql.connector import Error as MySQLError
+from mysql.connector import errorcode, pooling
 
+from . import sql
 
-@dataclass(frozen=True)
+
+def _text(value) -> str:
+    if type(value) is str:
+        return value
+    # Prepared (binary protocol) cursors may hand back text columns as bytes.
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "replace")
+    return str(value or "")
+
+
+_MISS = object()
+
+
+class _TTLCache:
+    """Small dict cache whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = float(ttl)
+        self.maxsize = max(1, int(maxsize))
+        self._data: dict = {}
+
+    def get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISS
+        if entry[0] <= time.monotonic():
+            self._data.pop(key, None)
+            return _MISS
+        return entry[1]
+
+    def put(self, key, value) -> None:
+        if key not in self._data and len(self._data) >= self.maxsize:
+            now = time.monotonic()
+            for k, entry in list(self._data.items()):
+                if entry[0] <= now:
+                    self._data.pop(k, None)
+            if len(self._data) >= self.maxsize:
+                # Entries share one ttl, so the earliest expiry is the oldest.
+                oldest = min(self._data.items(), key=lambda kv: kv[1][0], default=None)
+                if oldest is not None:
+                    self._data.pop(oldest[0], None)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+@dataclass(frozen=True, slots=True)
 class MySQLConfig:
     host: str
     port: int
@@ -15,9 +69,12 @@ class MySQLConfig:
     password: str
     database: str
     connection_timeout: int = 10
+    pool_size: int = 3
+    # Protocol compression: cheap CPU for fewer bytes over the remote link.
+    compress: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MusicRow:
     id: int
     name: str
@@ -25,133 +82,314 @@ class MusicRow:
     duration_seconds: Optional[int]
 
 
-@dataclass(frozen=True)
+def _music_row(row) -> MusicRow:
+    # Columns in the order of the music SELECTs in `sql`: id, name, link, duration_seconds.
+    rid, name, link, dur = row
+    if isinstance(dur, (str, bytes, bytearray)):
+        # Only schemas that store the duration as text need the string round-trip.
+        dur = _text(dur).strip() or None
+    return MusicRow(
+        id=rid,
+        name=_text(name),
+        link=_text(link),
+        duration_seconds=int(dur) if dur is not None else None,
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class AlertRow:
     id: int
     message: str
     severity: str
 
 
+@dataclass(frozen=True, slots=True)
+class AlertPoll:
+    """Pending alerts fetched by `MySQLRadioDB.poll_alerts()`."""
+
+    user_alert: Optional[AlertRow]
+    # Fixed-row AI alert (id=1), if it currently carries a message.
+    ai_fixed: Optional[AlertRow]
+    # Next queued AI alert after the caller's last seen id (ids above 1).
+    ai_alert: Optional[AlertRow]
+
+
 class MySQLRadioDB:
     def __init__(self, config: MySQLConfig):
         self.config = config
-
-    def _conn(self):
-        return mysql.connector.connect(
+        # Built once; every fallback connect reuses it.
+        self._connect_kwargs = self._conn_kwargs()
+        self._pool: Optional[pooling.MySQLConnectionPool] = None
+        self._pool_lock = threading.Lock()
+        # connection_id -> {stmt: prepared cursor}; see `_execute_prepared()`.
+        self._stmt_cache: dict[int, dict[str, object]] = {}
+        # Music rows rarely change: rows by id are kept for a while (and dropped
+        # as soon as `get_music_link()` sees a different link); the max id and
+        # latest row only briefly, to absorb back-to-back polls.
+        self._music_by_id = _TTLCache(30.0)
+        self._music_latest = _TTLCache(2.0, maxsize=2)
+        # Upcoming rows from the last `get_next_music_after()` query, as
+        # (after_id, rows in id order, expires at); sequential playback walks
+        # through it, re-checking each row's link, instead of running the
+        # range query once per track.
+        self._music_ahead: Optional[tuple[int, list[MusicRow], float]] = None
+        self.music_ahead_ttl = 300.0
+        # Optional columns ("table.column" -> present?), learned from the first
+        # query that needs them; see `_execute_variant()`.
+        self._schema: dict[str, bool] = {}
+        # (fetched at, value) of the last successful status read.
+        self._status_cache: tuple[float, Optional[str]] = (float("-inf"), None)
+        # True while connections are failing; diagnostics print once per outage.
+        self._conn_down = False
+
+    def invalidate_music_cache(self) -> None:
+        """Forget cached music rows (e.g. after editing the `music` table)."""
+        self._music_by_id.clear()
+        self._music_latest.clear()
+        self._music_ahead = None
+
+    def _conn_kwargs(self) -> dict:
+        return dict(
             host=self.config.host,
             port=self.config.port,
             user=self.config.user,
             password=self.config.password,
             database=self.config.database,
             connection_timeout=self.config.connection_timeout,
+            compress=bool(self.config.compress),
             use_unicode=True,
             charset="utf8mb4",
+            # Use the C extension (libmysqlclient) for protocol handling and row
+            # decoding; Connector/Python silently falls back to pure Python when
+            # the extension isn't available.
+            use_pure=False,
+            # Pooled sessions are not reset on checkout, so every statement must
+            # commit on its own or long-lived snapshots would hide new rows.
+            autocommit=True,
         )
 
-    def get_next_music_after(self, last_id: int) -> Optional[MusicRow]:
-        conn = self._conn()
+    def _get_pool(self) -> pooling.MySQLConnectionPool:
+        # Built lazily: creating the pool opens `pool_size` connections up front.
+        # The utf8mb4 charset is negotiated once per physical connection; with
+        # pool_reset_session=False checkouts don't re-issue SET NAMES.
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = pooling.MySQLConnectionPool(
+                        pool_size=max(1, int(self.config.pool_size)),
+                        pool_reset_session=False,
+                        **self._connect_kwargs,
+                    )
+        return self._pool
+
+    def _conn(self):
+        """Check out a connection; `close()` hands it back to the pool."""
         try:
-            cur = conn.cursor(dictionary=True)
-            cur.execute(
-                "SELECT id, name, link, duration_seconds "
-                "FROM music "
-                "WHERE id > %s "
-                "ORDER BY id ASC "
-                "LIMIT 1",
-                (int(last_id),),
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
-            dur = row.get("duration_seconds")
-            return MusicRow(
-                id=int(row.get("id") or 0),
-                name=str(row.get("name") or ""),
-                link=str(row.get("link") or ""),
-                duration_seconds=(int(dur) if dur is not None and str(dur).strip() != "" else None),
-            )
-        finally:
-            conn.close()
+            try:
+                conn = self._get_pool().get_connection()
+            except pooling.PoolError:
+                # Pool exhausted (more concurrent callers than pool_size): fall back
+                # to a one-off connection rather than failing the caller.
+                conn = mysql.connector.connect(**self._connect_kwargs)
+        except MySQLError as e:
+            # Every watcher retries within seconds; report the outage, not each retry.
+            if not self._conn_down:
+                self._conn_down = True
+                print("❌ MySQL connection failed!")
+                print(f"  Host: {self.config.host}:{self.config.port}")
+                print(f"  User: {self.config.user}")
+                print(f"  Database: {self.config.database}")
+                print(f"  Error: {e}")
+            raise
+        if self._conn_down:
+            self._conn_down = False
+            print("✅ MySQL connection restored")
+        return conn
+
+    def _prepared_cursor(self, conn, stmt: str):
+        """Return a prepared cursor for `stmt` on `conn`, reusing it across calls.
+
+        Prepared cursors are kept per pooled connection (pooled sessions are
+        never reset), so repeated polls only send the bound parameters instead
+        of re-parsing the statement text every time. One-off fallback
+        connections just get a plain cursor.
+        """
+        if not isinstance(conn, pooling.PooledMySQLConnection):
+            return conn.cursor()
+
+        conn_id = conn.connection_id
+        stmts = self._stmt_cache.get(conn_id)
+        if stmts is None:
+            # Reconnects change the id; drop stale entries instead of growing forever.
+            if len(self._stmt_cache) >= 2 * max(1, int(self.config.pool_size)):
+                self._stmt_cache.clear()
+            stmts = self._stmt_cache[conn_id] = {}
+        cur = stmts.get(stmt)
+        if cur is None:
+            cur = stmts[stmt] = conn.cursor(prepared=True)
+        return cur
+
+    def _forget_prepared(self, conn, stmt: str) -> None:
+        stmts = self._stmt_cache.get(getattr(conn, "connection_id", None))
+        if stmts:
+            stmts.pop(stmt, None)
+
+    def _execute_prepared(self, conn, stmt: str, params: tuple = ()) -> list:
+        """Run `stmt` through a server-side prepared statement and return all rows."""
+        cur = self._prepared_cursor(conn, stmt)
+        try:
+            cur.execute(stmt, params)
+            return cur.fetchall()
+        except MySQLError:
+            self._forget_prepared(conn, stmt)
+            raise
 
-    def get_music_by_id(self, music_id: int) -> Optional[MusicRow]:
-        conn = self._conn()
+    def _execute_prepared_update(self, conn, stmt: str, params: tuple = ()) -> int:
+        """Like `_execute_prepared()` for DELETE/UPDATE; returns the affected row count."""
+        cur = self._prepared_cursor(conn, stmt)
         try:
-            cur = conn.cursor(dictionary=True)
-            cur.execute(
-                "SELECT id, name, link, duration_seconds "
-                "FROM music "
-                "WHERE id = %s "
-                "LIMIT 1",
-                (int(music_id),),
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
-            dur = row.get("duration_seconds")
-            return MusicRow(
-                id=int(row.get("id") or 0),
-                name=str(row.get("name") or ""),
-                link=str(row.get("link") or ""),
-                duration_seconds=(int(dur) if dur is not None and str(dur).strip() != "" else None),
-            )
-        finally:
-            conn.close()
+            cur.execute(stmt, params)
+            conn.commit()
+            return cur.rowcount or 0
+        except MySQLError:
+            self._forget_prepared(conn, stmt)
+            raise
 
-    def get_music_max_id(self) -> int:
+    def _missing_column(self, feature: str, err: MySQLError) -> bool:
+        """Record `feature` as absent if `err` is an unknown-column error."""
+        if err.errno != errorcode.ER_BAD_FIELD_ERROR:
+            return False
+        self._schema[feature] = False
+        return True
+
+    def _execute_variant(self, conn, feature: str, stmt: str, fallback: str, params: tuple = ()) -> list:
+        """Run `stmt`, or `fallback` on schemas without the optional column `feature`.
+
+        The outcome is remembered, so schemas without the column don't pay for
+        a failing query on every poll.
+        """
+        if self._schema.get(feature, True):
+            try:
+                return self._execute_prepared(conn, stmt, params)
+            except MySQLError as e:
+                if not self._missing_column(feature, e):
+                    raise
+        return self._execute_prepared(conn, fallback, params)
+
+    def _query(self, stmt: str, params: tuple = (), *, feature: str = "", fallback: str = "") -> list:
+        """Check out a connection, run one prepared SELECT and return its rows.
+
+        With `feature`/`fallback`, runs through `_execute_variant()`.
+        """
         conn = self._conn()
         try:
-            cur = conn.cursor()
-            cur.execute("SELECT COALESCE(MAX(id), 0) FROM music")
-            row = cur.fetchone()
-            return int(row[0] if row and row[0] is not None else 0)
+            if feature:
+                return self._execute_variant(conn, feature, stmt, fallback, params)
+            return self._execute_prepared(conn, stmt, params)
         finally:
             conn.close()
 
+    def get_next_music_after(self, last_id: int) -> Optional[MusicRow]:
+        last_id = int(last_id)
+        ahead = self._music_ahead
+        if ahead is not None and ahead[0] <= last_id and ahead[2] > time.monotonic():
+            for row in ahead[1]:
+                if row.id > last_id:
+                    # The row may have been deleted or re-linked since the batch
+                    # was read; the PK link probe is much cheaper than the batch.
+                    if self.get_music_link(row.id) == row.link:
+                        return row
+                    break
+            # Past the end of the batch (new rows may have been added since), or
+            # the batch is stale.
+
+        rows = [_music_row(r) for r in self._query(sql.SELECT_MUSIC_AFTER, (last_id,))]
+        self._music_ahead = (last_id, rows, time.monotonic() + self.music_ahead_ttl)
+        return rows[0] if rows else None
+
+    def get_music_by_id(self, music_id: int) -> Optional[MusicRow]:
+        cached = self._music_by_id.get(int(music_id))
+        if cached is not _MISS:
+            return cached
+        rows = self._query(sql.SELECT_MUSIC_BY_ID, (int(music_id),))
+        if not rows:
+            # Not cached: a row inserted a moment later should show up.
+            return None
+        row = _music_row(rows[0])
+        self._music_by_id.put(int(music_id), row)
+        return row
+
+    def get_music_link(self, music_id: int) -> Optional[str]:
+        """Return just the `link` of a music row (cheap change probe)."""
+        rows = self._query(sql.SELECT_MUSIC_LINK, (int(music_id),))
+        if not rows:
+            self._music_by_id.pop(int(music_id))
+            return None
+        link = _text(rows[0][0])
+        cached = self._music_by_id.get(int(music_id))
+        if cached is not _MISS and cached.link != link:
+            self._music_by_id.pop(int(music_id))
+        return link
+
+    def get_music_max_id(self) -> int:
+        cached = self._music_latest.get("max_id")
+        if cached is not _MISS:
+            return cached
+        rows = self._query(sql.SELECT_MUSIC_MAX_ID)
+        max_id = int(rows[0][0] if rows and rows[0][0] is not None else 0)
+        self._music_latest.put("max_id", max_id)
+        return max_id
+
     def get_latest_music(self) -> Optional[MusicRow]:
-        conn = self._conn()
-        try:
-            cur = conn.cursor(dictionary=True)
-            cur.execute(
-                "SELECT id, name, link, duration_seconds "
-                "FROM music "
-                "ORDER BY id DESC "
-                "LIMIT 1"
-            )
-            row = cur.fetchone()
-            if not row:
-                return None
-            dur = row.get("duration_seconds")
-            return MusicRow(
-                id=int(row.get("id") or 0),
-                name=str(row.get("name") or ""),
-                link=str(row.get("link") or ""),
-                duration_seconds=(int(dur) if dur is not None and str(dur).strip() != "" else None),
-            )
-        finally:
-            conn.close()
+        cached = self._music_latest.get("latest")
+        if cached is not _MISS:
+            return cached
+        rows = self._query(sql.SELECT_LATEST_MUSIC)
+        row = _music_row(rows[0]) if rows else None
+        self._music_latest.put("latest", row)
+        return row
 
     def get_next_ai_alert_after(self, last_id: int) -> Optional[AlertRow]:
-        conn = self._conn()
+        rows = self._query(sql.SELECT_AI_ALERT_AFTER, (int(last_id),))
+        if not rows:
+            return None
+        rid, message, severity = rows[0]
+        return AlertRow(id=rid, message=_text(message), severity=_text(severity))
+
+    def poll_alerts(self, last_ai_id: int) -> AlertPoll:
+        """Fetch the pending user/AI alerts in a single round-trip."""
         try:
-            cur = conn.cursor(dictionary=True)
-            cur.execute(
-                "SELECT id, message, severity "
-                "FROM ai_alert "
-                "WHERE id > %s AND message IS NOT NULL AND TRIM(message) != '' "
-                "ORDER BY id ASC "
-                "LIMIT 1",
-                (int(last_id),),
+            rows = self._query(
+                sql.POLL_ALERTS,
+                (int(last_ai_id),),
+                feature="user_alert.last_updated",
+                fallback=sql.POLL_ALERTS_NO_TS,
             )
-            row = cur.fetchone()
-            if not row:
-                return None
-            return AlertRow(
-                id=int(row.get("id") or 0),
-                message=str(row.get("message") or ""),
-                severity=str(row.get("severity") or ""),
+        except MySQLError:
+            # Schemas with mismatched collations between the tables use one
+            # query per table below.
+            rows = None
+
+        if rows is None:
+            ai_fixed = self.get_next_ai_alert_after(0)
+            return AlertPoll(
+                user_alert=self.get_next_user_alert_after(0),
+                ai_fixed=ai_fixed if ai_fixed and ai_fixed.id == 1 else None,
+                ai_alert=self.get_next_ai_alert_after(max(int(last_ai_id), 1)),
             )
-        finally:
-            conn.close()
+
+        found = {}
+        for kind, rid, message, severity in rows:
+            found[_text(kind)] = AlertRow(
+                id=rid,
+                message=_text(message),
+                severity=_text(severity),
+            )
+        return AlertPoll(
+            user_alert=found.get("user"),
+            ai_fixed=found.get("ai_fixed"),
+            ai_alert=found.get("ai"),
+        )
 
     def delete_ai_alert(self, alert_id: int) -> bool:
         """Delete an AI alert by id.
@@ -160,10 +398,27 @@ class MySQLRadioDB:
         """
         conn = self._conn()
         try:
-            cur = conn.cursor()
-            cur.execute("DELETE FROM ai_alert WHERE id=%s", (int(alert_id),))
-            conn.commit()
-            return bool(cur.rowcount and cur.rowcount > 0)
+            return self._execute_prepared_update(conn, sql.DELETE_AI_ALERT, (int(alert_id),)) > 0
+        finally:
+            conn.close()
+
+    def _ack(self, table: str, delete_stmt: str, clear_stmt: str, alert_id: int) -> bool:
+        """DELETE the alert row, or clear its message; both on one connection.
+
+        A DELETE refused for lack of privileges is remembered, so later acks
+        go straight to the UPDATE.
+        """
+        params = (int(alert_id),)
+        conn = self._conn()
+        try:
+            if self._schema.get(f"{table}.delete", True):
+                try:
+                    if self._execute_prepared_update(conn, delete_stmt, params) > 0:
+                        return True
+                except MySQLError as e:
+                    if e.errno == errorcode.ER_TABLEACCESS_DENIED_ERROR:
+                        self._schema[f"{table}.delete"] = False
+            return self._execute_prepared_update(conn, clear_stmt, params) > 0
         finally:
             conn.close()
 
@@ -173,101 +428,90 @@ class MySQLRadioDB:
         Tries DELETE first. If no row was deleted (or DELETE fails due to
         permissions), falls back to clearing the message.
         """
-        try:
-            if self.delete_ai_alert(alert_id):
-                return True
-        except MySQLError:
-            pass
+        return self._ack("ai_alert", sql.DELETE_AI_ALERT, sql.CLEAR_AI_ALERT, alert_id)
+
+    def pop_next_user_alert(self) -> Optional[AlertRow]:
+        """Fetch and delete the next user alert in one transaction.
 
+        The row is locked with `FOR UPDATE SKIP LOCKED`, so several clients
+        can drain the queue concurrently without popping the same alert.
+
+        Prefer using `get_next_user_alert()` + `delete_user_alert()` so the
+        message is only deleted after it is successfully spoken/played.
+        """
         conn = self._conn()
         try:
+            conn.start_transaction()
             cur = conn.cursor()
-            cur.execute("UPDATE ai_alert SET message='' WHERE id=%s", (int(alert_id),))
+            locked = False
+            if self._schema.get("user_alert.last_updated", True):
+                try:
+                    cur.execute(sql.LOCK_NEXT_USER_ALERT)
+                    locked = True
+                except MySQLError as e:
+                    if not self._missing_column("user_alert.last_updated", e):
+                        raise
+            if not locked:
+                cur.execute(sql.LOCK_NEXT_USER_ALERT_NO_TS)
+            row = cur.fetchone()
+            if not row:
+                conn.commit()
+                return None
+            cur.execute(sql.DELETE_USER_ALERT, (row[0],))
             conn.commit()
-            return bool(cur.rowcount and cur.rowcount > 0)
+            return AlertRow(id=row[0], message=_text(row[1]), severity="")
+        except Exception:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            raise
         finally:
             conn.close()
 
-    def pop_next_user_alert(self) -> Optional[AlertRow]:
-        """Fetch and delete the next user alert.
-
-        Prefer using `get_next_user_alert()` + `delete_user_alert()` so the
-        message is only deleted after it is successfully spoken/played.
-        """
-        alert = self.get_next_user_alert()
-        if not alert:
-            return None
-        self.delete_user_alert(alert.id)
-        return alert
-
     def get_next_user_alert(self) -> Optional[AlertRow]:
         """Fetch the next user alert without deleting it."""
         return self.get_next_user_alert_after(0)
 
     def get_next_user_alert_after(self, last_id: int) -> Optional[AlertRow]:
         """Fetch the next user alert after last_id without deleting it."""
-        conn = self._conn()
-        try:
-            cur = conn.cursor(dictionary=True)
-            try:
-                cur.execute(
-                    "SELECT id, message "
-                    "FROM user_alert "
-                    "WHERE id > %s AND message IS NOT NULL AND TRIM(message) != '' "
-                    "AND (last_updated IS NULL OR last_updated >= (UTC_TIMESTAMP() - INTERVAL 1 HOUR)) "
-                    "ORDER BY id ASC "
-                    "LIMIT 1",
-                    (int(last_id),),
-                )
-            except MySQLError:
-                # Some schemas don't have last_updated; retry without it.
-                cur.execute(
-                    "SELECT id, message "
-                    "FROM user_alert "
-                    "WHERE id > %s AND message IS NOT NULL AND TRIM(message) != '' "
-                    "ORDER BY id ASC "
-                    "LIMIT 1",
-                    (int(last_id),),
-                )
-            row = cur.fetchone()
-            if not row:
-                return None
-
-            return AlertRow(
-                id=int(row.get("id") or 0),
-                message=str(row.get("message") or ""),
-                severity="",
-            )
-        finally:
-            conn.close()
+        rows = self._query(
+            sql.SELECT_USER_ALERT_AFTER,
+            (int(last_id),),
+            feature="user_alert.last_updated",
+            fallback=sql.SELECT_USER_ALERT_AFTER_NO_TS,
+        )
+        if not rows:
+            return None
+        rid, message = rows[0]
+        return AlertRow(id=rid, message=_text(message), severity="")
 
-    def get_server_status(self) -> Optional[str]:
+    def get_server_status(self, *, max_age: float = 1.0) -> Optional[str]:
         """Return current server status string from `status_server` table.
 
         Expected values: 'net', 'both', or anything else (treated as disabled).
         Best-effort: returns None if the table/column doesn't exist or on errors.
+        A value read less than `max_age` seconds ago is returned without a
+        query; pass 0 to always read the table.
         """
-        conn = self._conn()
+        now = time.monotonic()
+        fetched_at, cached = self._status_cache
+        if now - fetched_at < max_age:
+            return cached
+
         try:
-            cur = conn.cursor(dictionary=True)
             # Common patterns: either a single-row table or latest-row semantics.
-            try:
-                cur.execute(
-                    "SELECT status FROM status_server ORDER BY id DESC LIMIT 1"
-                )
-            except MySQLError:
-                cur.execute(
-                    "SELECT status FROM status_server LIMIT 1"
-                )
-            row = cur.fetchone()
-            if not row:
-                return None
-            val = row.get("status")
-            return str(val).strip().lower() if val is not None else None
+            rows = self._query(
+                sql.SELECT_SERVER_STATUS,
+                feature="status_server.id",
+                fallback=sql.SELECT_SERVER_STATUS_NO_ID,
+            )
         except MySQLError:
             return None
-        finally:
-            conn.close()
+        val = rows[0][0] if rows else None
+        status = _text(val).strip().lower() if val is not None else None
+        self._status_cache = (now, status)
+        return status
 
     def delete_user_alert(self, alert_id: int) -> bool:
         """Delete a user alert by id.
@@ -276,10 +520,7 @@ class MySQLRadioDB:
         """
         conn = self._conn()
         try:
-            cur = conn.cursor()
-            cur.execute("DELETE FROM user_alert WHERE id=%s", (int(alert_id),))
-            conn.commit()
-            return bool(cur.rowcount and cur.rowcount > 0)
+            return self._execute_prepared_update(conn, sql.DELETE_USER_ALERT, (int(alert_id),)) > 0
         finally:
             conn.close()
 
@@ -289,17 +530,30 @@ class MySQLRadioDB:
         Tries DELETE first. If no row was deleted (or DELETE fails due to
         permissions), falls back to clearing the message.
         """
-        try:
-            if self.delete_user_alert(alert_id):
-                return True
-        except MySQLError:
-            pass
+        return self._ack("user_alert", sql.DELETE_USER_ALERT, sql.CLEAR_USER_ALERT, alert_id)
+
+    def ensure_indexes(self) -> bool:
+        """One-shot migration: index the non-empty rows of both alert tables.
 
+        Adds a stored `message_nonempty` generated column plus an index on
+        (message_nonempty, id). The alert queries already use the matching
+        expression, so MySQL switches to an index seek instead of scanning
+        cleared rows. Needs ALTER privilege; safe to run again. Returns True
+        if both tables have the column afterwards.
+        """
+        ok = True
         conn = self._conn()
         try:
             cur = conn.cursor()
-            cur.execute("UPDATE user_alert SET message='' WHERE id=%s", (int(alert_id),))
-            conn.commit()
-            return bool(cur.rowcount and cur.rowcount > 0)
+            for table in ("ai_alert", "user_alert"):
+                try:
+                    cur.execute(sql.ADD_MESSAGE_NONEMPTY.format(table=table))
+                    print(f"✅ Indexed non-empty messages in {table}")
+                except MySQLError as e:
+                    if e.errno == errorcode.ER_DUP_FIELDNAME:
+                        continue
+                    print(f"⚠️  Could not index {table}: {e}")
+                    ok = False
         finally:
             conn.close()
+        return ok
@@ -0,0 +1,142 @@
+"""SQL statements used by `MySQLRadioDB`.
+
+Kept as module-level constants so the poll loops never rebuild statement
+text, and so each prepared statement has one stable key.
+"""
+
+# Same expression as the `message_nonempty` column that
+# `MySQLRadioDB.ensure_indexes()` can add; when the column exists, MySQL uses
+# its index instead of evaluating TRIM() row by row.
+_HAS_MESSAGE = "(CHAR_LENGTH(TRIM(message)) > 0) = 1 "
+
+_RECENT_USER_ALERT = "AND (last_updated IS NULL OR last_updated >= (UTC_TIMESTAMP() - INTERVAL 1 HOUR)) "
+
+# Sequential playback reads the upcoming tracks in batches of this many rows.
+MUSIC_BATCH_SIZE = 32
+
+SELECT_MUSIC_AFTER = (
+    "SELECT id, name, link, duration_seconds "
+    "FROM music "
+    "WHERE id > %s "
+    "ORDER BY id ASC "
+    f"LIMIT {MUSIC_BATCH_SIZE}"
+)
+
+SELECT_MUSIC_BY_ID = (
+    "SELECT id, name, link, duration_seconds "
+    "FROM music "
+    "WHERE id = %s "
+    "LIMIT 1"
+)
+
+SELECT_MUSIC_LINK = "SELECT link FROM music WHERE id = %s LIMIT 1"
+
+SELECT_MUSIC_MAX_ID = "SELECT COALESCE(MAX(id), 0) FROM music"
+
+SELECT_LATEST_MUSIC = (
+    "SELECT id, name, link, duration_seconds "
+    "FROM music "
+    "ORDER BY id DESC "
+    "LIMIT 1"
+)
+
+SELECT_AI_ALERT_AFTER = (
+    "SELECT id, message, severity "
+    "FROM ai_alert "
+    "WHERE id > %s AND "
+    + _HAS_MESSAGE
+    + "ORDER BY id ASC "
+    "LIMIT 1"
+)
+
+
+def _poll_alerts(user_filter: str) -> str:
+    return (
+        "(SELECT 'user' AS kind, id, message, '' AS severity "
+        "FROM user_alert "
+        "WHERE id > 0 AND "
+        + _HAS_MESSAGE
+        + user_filter
+        + "ORDER BY id ASC LIMIT 1) "
+        "UNION ALL "
+        "(SELECT 'ai_fixed' AS kind, id, message, severity "
+        "FROM ai_alert "
+        "WHERE id = 1 AND "
+        + _HAS_MESSAGE
+        + "LIMIT 1) "
+        "UNION ALL "
+        "(SELECT 'ai' AS kind, id, message, severity "
+        "FROM ai_alert "
+        "WHERE id > GREATEST(%s, 1) AND "
+        + _HAS_MESSAGE
+        + "ORDER BY id ASC LIMIT 1)"
+    )
+
+
+POLL_ALERTS = _poll_alerts(_RECENT_USER_ALERT)
+
+# Fallback for schemas without user_alert.last_updated.
+POLL_ALERTS_NO_TS = _poll_alerts("")
+
+DELETE_AI_ALERT = "DELETE FROM ai_alert WHERE id=%s"
+
+CLEAR_AI_ALERT = "UPDATE ai_alert SET message='' WHERE id=%s"
+
+LOCK_NEXT_USER_ALERT = (
+    "SELECT id, message "
+    "FROM user_alert "
+    "WHERE "
+    + _HAS_MESSAGE
+    + _RECENT_USER_ALERT
+    + "ORDER BY id ASC "
+    "LIMIT 1 "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+# Fallback for schemas without user_alert.last_updated.
+LOCK_NEXT_USER_ALERT_NO_TS = (
+    "SELECT id, message "
+    "FROM user_alert "
+    "WHERE "
+    + _HAS_MESSAGE
+    + "ORDER BY id ASC "
+    "LIMIT 1 "
+    "FOR UPDATE SKIP LOCKED"
+)
+
+SELECT_USER_ALERT_AFTER = (
+    "SELECT id, message "
+    "FROM user_alert "
+    "WHERE id > %s AND "
+    + _HAS_MESSAGE
+    + _RECENT_USER_ALERT
+    + "ORDER BY id ASC "
+    "LIMIT 1"
+)
+
+# Fallback for schemas without user_alert.last_updated.
+SELECT_USER_ALERT_AFTER_NO_TS = (
+    "SELECT id, message "
+    "FROM user_alert "
+    "WHERE id > %s AND "
+    + _HAS_MESSAGE
+    + "ORDER BY id ASC "
+    "LIMIT 1"
+)
+
+SELECT_SERVER_STATUS = "SELECT status FROM status_server ORDER BY id DESC LIMIT 1"
+
+# Fallback for a single-row status table without an id column.
+SELECT_SERVER_STATUS_NO_ID = "SELECT status FROM status_server LIMIT 1"
+
+DELETE_USER_ALERT = "DELETE FROM user_alert WHERE id=%s"
+
+CLEAR_USER_ALERT = "UPDATE user_alert SET message='' WHERE id=%s"
+
+# One-shot migration, see `MySQLRadioDB.ensure_indexes()`; {table} is one of
+# the alert tables, never user input.
+ADD_MESSAGE_NONEMPTY = (
+    "ALTER TABLE {table} "
+    "ADD COLUMN message_nonempty TINYINT AS (CHAR_LENGTH(TRIM(message)) > 0) STORED, "
+    "ADD INDEX idx_message_nonempty_id (message_nonempty, id)"
+)
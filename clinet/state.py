@@ -1,7 +1,14 @@
 import json
 import os
+import stat
+import tempfile
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib json module.
+    orjson = None
+
 
 @dataclass
 class ClientState:
@@ -11,12 +18,62 @@ class ClientState:
     last_user_alert_id: int = 0
 
 
+def read_json(path: str):
+    with open(path, "rb") as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _read_umask() -> int:
+    # os.umask() can only be read by setting it, which would briefly change it
+    # for every other thread; Linux exposes it read-only instead.
+    try:
+        with open("/proc/self/status", "rb") as f:
+            for line in f:
+                if line.startswith(b"Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    return 0o022
+
+
+def _file_mode(path: str) -> int:
+    # mkstemp creates 0600 files; keep the mode of the file being replaced,
+    # or what a plain open() would have given a new one.
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_read_umask()
+
+
+def write_json(path: str, data) -> None:
+    """Write `data` as indented JSON, replacing `path` in one rename.
+
+    Readers (and a crash mid-write) never see a truncated file.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    fd, tmp_path = tempfile.mkstemp(prefix=".client_state_", suffix=".tmp", dir=os.path.dirname(path) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def load_state(path: str) -> ClientState:
     if not os.path.exists(path):
         return ClientState()
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f) or {}
+        data = read_json(path) or {}
         return ClientState(
             last_music_id=int(data.get("last_music_id", 0) or 0),
             last_music_link=str(data.get("last_music_link", "") or ""),
@@ -27,16 +84,36 @@ def load_state(path: str) -> ClientState:
         return ClientState()
 
 
+# path -> (payload, mtime_ns) of our last write; lets unchanged saves be skipped.
+_last_saved: dict = {}
+# Directories already created by save_state; makedirs only runs once per dir.
+_dirs_ensured: set = set()
+
+
 def save_state(path: str, state: ClientState) -> None:
-    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(
-            {
-                "last_music_id": int(state.last_music_id),
-                "last_music_link": str(state.last_music_link or ""),
-                "last_ai_alert_id": int(state.last_ai_alert_id),
-                "last_user_alert_id": int(state.last_user_alert_id),
-            },
-            f,
-            indent=2,
-        )
+    payload = {
+        "last_music_id": int(state.last_music_id),
+        "last_music_link": str(state.last_music_link or ""),
+        "last_ai_alert_id": int(state.last_ai_alert_id),
+        "last_user_alert_id": int(state.last_user_alert_id),
+    }
+    # Skip the rewrite when nothing changed and nobody else touched the file
+    # since our last write (the reset monitor edits it in place).
+    prev = _last_saved.get(path)
+    if prev is not None and prev[0] == payload:
+        try:
+            if os.stat(path).st_mtime_ns == prev[1]:
+                return
+        except OSError:
+            pass
+
+    # makedirs accepts relative paths, so there is no need to resolve them.
+    directory = os.path.dirname(path) or "."
+    if directory not in _dirs_ensured:
+        os.makedirs(directory, exist_ok=True)
+        _dirs_ensured.add(directory)
+    write_json(path, payload)
+    try:
+        _last_saved[path] = (payload, os.stat(path).st_mtime_ns)
+    except OSError:
+        _last_saved.pop(path, None)
@@ -1,29 +1,67 @@
 from __future__ import annotations
 
+import io
 import os
 import re
 import tempfile
 import time
-from typing import Dict
+from typing import Dict, Optional
 
 from gtts import gTTS
 
+from .tts_cache import TTSCache
+
+
+# Malayalam Unicode block: U+0D00–U+0D7F
+_ML_RE = re.compile(r"[\u0d00-\u0d7f]")
+# Common zero-width / direction markers that can confuse tokenizers.
+_ZW_RE = re.compile(r"[\u200b-\u200f\u202a-\u202e]")
+
 
 def detect_language(text: str) -> str:
-    # Malayalam Unicode block: U+0D00–U+0D7F
-    for ch in text:
-        if "\u0d00" <= ch <= "\u0d7f":
-            return "ml"
-    return "en"
+    # isascii() reads a flag CPython keeps on every str, so English text is O(1).
+    if text.isascii():
+        return "en"
+    return "ml" if _ML_RE.search(text) else "en"
 
 
-def generate_voice_from_text(text: str, *, lang: str) -> Dict[str, str]:
-    cleaned = " ".join(str(text).strip().split())
-    # Strip a few common zero-width / direction markers that can confuse tokenizers.
-    cleaned = re.sub(r"[\u200b-\u200f\u202a-\u202e]", "", cleaned)
+def generate_voice_from_text(
+    text: str,
+    *,
+    lang: str,
+    cache: Optional[TTSCache] = None,
+    in_memory: bool = False,
+) -> Dict[str, object]:
+    """Synthesize `text` and describe where the audio is.
+
+    With a cache the audio is a file in the cache directory. Without one,
+    `in_memory=True` returns the MP3 as `bytes` (and an empty `file`) so the
+    caller can pipe it to a player without a temp file.
+    """
+    cleaned = _ZW_RE.sub("", " ".join(str(text).split()))
     if not cleaned:
         raise ValueError("text is empty")
 
+    # Malayalam sometimes works more reliably with an India TLD.
+    tld = "co.in" if lang == "ml" else "com"
+
+    if cache is not None:
+        def _synth(path: str) -> None:
+            gTTS(text=cleaned, lang=lang, tld=tld, slow=False).save(path)
+
+        out_path, hit = cache.get_or_synth(cleaned, lang, _synth)
+        return {
+            "file": out_path,
+            "lang": lang,
+            "text": cleaned,
+            "engine": "gTTS (cached)" if hit else "gTTS",
+        }
+
+    if in_memory:
+        buf = io.BytesIO()
+        gTTS(text=cleaned, lang=lang, tld=tld, slow=False).write_to_fp(buf)
+        return {"file": "", "bytes": buf.getvalue(), "lang": lang, "text": cleaned, "engine": "gTTS"}
+
     # Use a unique file name to avoid collisions when multiple parts are spoken quickly.
     fd, out_path = tempfile.mkstemp(prefix="alert_", suffix=".mp3")
     try:
@@ -31,8 +69,6 @@ def generate_voice_from_text(text: str, *, lang: str) -> Dict[str, str]:
     except Exception:
         pass
 
-    # Malayalam sometimes works more reliably with an India TLD.
-    tld = "co.in" if lang == "ml" else "com"
     tts = gTTS(text=cleaned, lang=lang, tld=tld, slow=False)
     tts.save(out_path)
 
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import unicodedata
+from typing import Callable, Tuple
+
+
+DEFAULT_MAX_ENTRIES = 200
+
+
+def default_cache_dir() -> str:
+    """Per-user cache location: `$XDG_CACHE_HOME/fm_client_tts` or `~/.cache/fm_client_tts`."""
+    base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "fm_client_tts")
+
+
+class TTSCache:
+    """Disk cache of synthesized speech, keyed by SHA-256 of (lang, text).
+
+    Repeated alert texts are replayed from disk instead of being sent to the
+    TTS backend again. Entries are evicted least-recently-used first once
+    `max_entries` is exceeded (file mtime is refreshed on every hit).
+    """
+
+    def __init__(self, cache_dir: str, *, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_entries = max(1, int(max_entries))
+        # Cached files are played as-is, so nobody else may be able to put
+        # files here.
+        os.makedirs(self.cache_dir, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid"):
+            st = os.stat(self.cache_dir)
+            if st.st_uid != os.getuid():
+                raise PermissionError(f"TTS cache dir {self.cache_dir} is owned by another user")
+            if st.st_mode & 0o077:
+                os.chmod(self.cache_dir, 0o700)
+
+    @staticmethod
+    def key(text: str, lang: str) -> str:
+        norm = unicodedata.normalize("NFC", str(text)).strip()
+        return hashlib.sha256(f"{lang}\0{norm}".encode("utf-8")).hexdigest()
+
+    def path_for(self, text: str, lang: str) -> str:
+        return os.path.join(self.cache_dir, self.key(text, lang) + ".mp3")
+
+    def get_or_synth(self, text: str, lang: str, synth_fn: Callable[[str], None]) -> Tuple[str, bool]:
+        """Return `(path, hit)` for the audio of `text`.
+
+        On a miss, `synth_fn(path)` must write the audio to the given path; it
+        is called with a temp file that is atomically renamed into place.
+        """
+        path = self.path_for(text, lang)
+        if os.path.isfile(path):
+            try:
+                os.utime(path, None)
+            except OSError:
+                pass
+            return path, True
+
+        fd, tmp_path = tempfile.mkstemp(prefix="tts_", suffix=".tmp", dir=self.cache_dir)
+        try:
+            os.close(fd)
+        except Exception:
+            pass
+        try:
+            synth_fn(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        self._evict()
+        return path, False
+
+    def _evict(self) -> None:
+        try:
+            entries = [e for e in os.scandir(self.cache_dir) if e.name.endswith(".mp3")]
+        except OSError:
+            return
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        # Another client sharing the cache may delete files mid-scan.
+        aged = []
+        for e in entries:
+            try:
+                aged.append((e.stat().st_mtime, e.path))
+            except OSError:
+                excess -= 1
+        aged.sort()
+        for _, path in aged[:max(0, excess)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
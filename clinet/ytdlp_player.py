@@ -1,25 +1,75 @@
 from __future__ import annotations
 
-import json
 import os
 import subprocess
 import time
 import platform
+import shutil
 import signal
-import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from typing import Optional
 
+import yt_dlp
 
-# Always use python -m yt_dlp (never call yt-dlp directly)
-YT_DLP = [sys.executable, "-m", "yt_dlp"]
+
+# Links ffplay can open as-is (radio streams, plain files); no yt-dlp needed.
+_DIRECT_MEDIA_EXTS = (".mp3", ".m4a", ".aac", ".ogg", ".opus", ".flac", ".wav", ".m3u8")
+
+# One YoutubeDL per thread and option set; instances are not thread-safe but
+# are cheap to keep around.
+_ydl_local = threading.local()
+
+# socket_timeout only bounds each network read, so a slow extraction that
+# keeps trickling data can still run for minutes. Resolution and duration
+# probes run here so the caller can give up after its timeout; a stuck
+# worker is abandoned.
+_resolve_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="yt-dlp")
+
+
+def _extract_info(url: str, *, audio_only: bool, timeout: Optional[float] = None) -> dict:
+    key = ("audio" if audio_only else "info", timeout)
+    cache = getattr(_ydl_local, "instances", None)
+    if cache is None:
+        cache = _ydl_local.instances = {}
+    ydl = cache.get(key)
+    if ydl is None:
+        opts = {"quiet": True, "no_warnings": True, "noplaylist": True}
+        if audio_only:
+            opts["format"] = "bestaudio"
+        if timeout is not None:
+            opts["socket_timeout"] = timeout
+        ydl = cache[key] = yt_dlp.YoutubeDL(opts)
+    return ydl.extract_info(url, download=False) or {}
 
 
 class StreamPlayer:
     """Optimized Linux-only stream player using yt-dlp + ffplay."""
 
-    def __init__(self):
+    def __init__(self, *, url_ttl: float = 300.0, max_cached_urls: int = 128, resolve_timeout: float = 30.0):
         self.player_process: Optional[subprocess.Popen] = None
-        self._cache: dict[str, str] = {}
+        # A stalled yt-dlp (network hang, captcha wall) must not block playback forever.
+        self.resolve_timeout = float(resolve_timeout)
+        # page url -> (stream url, expires at). Stream URLs are signed and expire
+        # upstream, so they are only reused for a while (ducking, resume after
+        # an alert) rather than forever. Insertion order doubles as age order.
+        self.url_ttl = float(url_ttl)
+        self.max_cached_urls = max(1, int(max_cached_urls))
+        self._cache: dict[str, tuple[str, float]] = {}
+        # prefetch() runs on the client's executor while start() runs on the
+        # playback thread; both touch _cache.
+        self._cache_lock = threading.Lock()
+        # Volume ffplay was started with, and (ffplay pid, PulseAudio sink input)
+        # for in-place volume changes.
+        self._spawn_vol = 0
+        self._sink_input: Optional[tuple[int, str]] = None
+        self.rescan_players()
+
+    def rescan_players(self) -> None:
+        """Re-resolve the ffplay/pactl executables (after installing them or changing PATH)."""
+        # Resolved once so each start() execs it directly instead of walking PATH.
+        self.ffplay = shutil.which("ffplay") or "ffplay"
+        self.pactl = shutil.which("pactl") if os.name != "nt" else None
 
     # -------------------- Process Handling --------------------
 
@@ -49,38 +99,54 @@ class StreamPlayer:
     # -------------------- yt-dlp Resolution --------------------
 
     def _resolve_audio_url(self, url: str) -> str:
-        if url in self._cache:
-            return self._cache[url]
-
-        cmd = YT_DLP + [
-            "-g",
-            "-f",
-            "bestaudio",
-            "--no-playlist",
-            url,
-        ]
-
-        resolved = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-
-        if resolved.returncode != 0:
-            details = (resolved.stderr or resolved.stdout or "").strip()
-            raise RuntimeError(f"yt-dlp failed:\n{details}")
+        if url.split("?", 1)[0].lower().endswith(_DIRECT_MEDIA_EXTS):
+            return url
+
+        with self._cache_lock:
+            cached = self._cache.get(url)
+            if cached is not None:
+                if cached[1] > time.monotonic():
+                    return cached[0]
+                self._cache.pop(url, None)
+
+        # Resolved outside the lock so a slow lookup doesn't stall the other thread.
+        stream = self._resolve_in_process(url, self.resolve_timeout)
+        with self._cache_lock:
+            self._cache.pop(url, None)
+            self._cache[url] = (stream, time.monotonic() + self.url_ttl)
+            while len(self._cache) > self.max_cached_urls:
+                self._cache.pop(next(iter(self._cache)), None)
+        return stream
 
-        lines = (resolved.stdout or "").strip().splitlines()
-        if not lines:
+    @staticmethod
+    def _resolve_in_process(url: str, timeout: float) -> str:
+        future = _resolve_pool.submit(_extract_info, url, audio_only=True, timeout=timeout)
+        try:
+            info = future.result(timeout=timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise RuntimeError(f"yt-dlp timed out after {timeout:g}s") from None
+        except Exception as e:
+            raise RuntimeError(f"yt-dlp failed:\n{e}") from e
+
+        stream = info.get("url")
+        if not stream:
             raise RuntimeError("yt-dlp returned no stream URL")
+        return str(stream)
 
-        stream = lines[-1].strip()
-        self._cache[url] = stream
-        return stream
+    def prefetch(self, url: str) -> None:
+        """Resolve and cache the stream URL of `url` ahead of `start()` (best-effort)."""
+        try:
+            self._resolve_audio_url(url)
+        except Exception:
+            pass
 
     # -------------------- Player Control --------------------
 
+    @staticmethod
+    def _clamp_vol(volume) -> int:
+        return min(100, max(0, int(volume)))
+
     def is_playing(self) -> bool:
         return bool(self.player_process and self.player_process.poll() is None)
 
@@ -88,10 +154,62 @@ class StreamPlayer:
         self.stop()
 
         stream_url = self._resolve_audio_url(url)
-        vol = max(0, min(100, int(volume)))
+        self._spawn_vol = self._clamp_vol(volume)
+        self.player_process = self._spawn_player(stream_url, self._spawn_vol, position)
+
+    def set_volume(self, volume: int) -> bool:
+        """Change the running track's volume in place through PulseAudio (best-effort).
+
+        Returns False when that isn't possible (no pactl, nothing playing, the
+        stream isn't registered yet); callers then restart with `start()`.
+        """
+        proc = self.player_process
+        if not self.pactl or self._spawn_vol <= 0 or not self.is_playing():
+            return False
+        sink_input = self._find_sink_input(proc.pid)
+        if sink_input is None:
+            return False
+        # ffplay's own -volume still applies, so scale relative to it.
+        percent = round(100 * self._clamp_vol(volume) / self._spawn_vol)
+        try:
+            res = subprocess.run(
+                [self.pactl, "set-sink-input-volume", sink_input, f"{percent}%"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2,
+                check=False,
+            )
+        except Exception:
+            return False
+        return res.returncode == 0
+
+    def _find_sink_input(self, pid: int) -> Optional[str]:
+        if self._sink_input is not None and self._sink_input[0] == pid:
+            return self._sink_input[1]
+        try:
+            res = subprocess.run(
+                [self.pactl, "list", "sink-inputs"],
+                capture_output=True,
+                text=True,
+                timeout=2,
+                check=False,
+                env={**os.environ, "LC_ALL": "C"},
+            )
+        except Exception:
+            return None
+        current = None
+        for line in (res.stdout or "").splitlines():
+            line = line.strip()
+            if line.startswith("Sink Input #"):
+                current = line[len("Sink Input #"):]
+            elif current and line == f'application.process.id = "{pid}"':
+                self._sink_input = (pid, current)
+                return current
+        return None
 
+    def _spawn_player(self, stream_url: str, vol: int, position: float = 0.0) -> subprocess.Popen:
         player_cmd = [
-            "ffplay",
+            self.ffplay,
             "-vn",
             "-nodisp",
             "-autoexit",
@@ -102,31 +220,34 @@ class StreamPlayer:
             player_cmd.extend(["-ss", str(float(position))])
         player_cmd.append(stream_url)
 
+        # ffplay gets its own process group so stop() can kill the whole tree.
         if os.name == "nt":
-            self.player_process = subprocess.Popen(
+            return subprocess.Popen(
                 player_cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL,
                 creationflags=subprocess.CREATE_NEW_PROCESS_GROUP,
             )
-        else:
-            self.player_process = subprocess.Popen(
-                player_cmd,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                preexec_fn=os.setsid,
-            )
+        return subprocess.Popen(
+            player_cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
 
     def play(self, url: str, *, duration: Optional[int] = None):
         self.start(url)
 
-        if duration is not None:
-            time.sleep(int(duration))
+        # Poll instead of wait()/sleep() so stop() from another thread (or
+        # Ctrl+C) takes effect within a quarter second.
+        deadline = None if duration is None else time.monotonic() + int(duration)
+        try:
+            while self.is_playing():
+                if deadline is not None and time.monotonic() >= deadline:
+                    break
+                time.sleep(0.25)
+        finally:
             self.stop()
-            return
-
-        self.player_process.wait()
-        self.player_process = None
 
 
 # -------------------- Duration Utility --------------------
@@ -135,29 +256,11 @@ def get_media_duration_seconds(url: str, *, timeout: int = 45) -> Optional[int]:
     if not url:
         return None
 
-    cmd = YT_DLP + [
-        "-J",
-        "--no-playlist",
-        url,
-    ]
-
-    try:
-        proc = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
-    except Exception:
-        return None
-
-    if proc.returncode != 0 or not proc.stdout:
-        return None
-
+    future = _resolve_pool.submit(_extract_info, url, audio_only=False, timeout=timeout)
     try:
-        info = json.loads(proc.stdout)
+        info = future.result(timeout=timeout)
     except Exception:
+        future.cancel()
         return None
 
     if info.get("is_live") is True:
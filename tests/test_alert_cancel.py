@@ -0,0 +1,96 @@
+import threading
+import unittest
+from unittest import mock
+
+try:
+    from clinet import main
+    from clinet.mysql_client import AlertRow
+    from clinet.state import ClientState
+except ImportError:  # mysql-connector-python / gTTS not installed
+    main = None
+
+
+class _CancelledProc:
+    """Fake ffplay whose playback is cut off by `cancel_current_tts()` mid-way."""
+
+    returncode = -15
+
+    def __init__(self, client):
+        self._client = client
+        self._done = False
+
+    def poll(self):
+        return self.returncode if self._done else None
+
+    def terminate(self):
+        self._done = True
+
+    def communicate(self, input=None):
+        self._client.cancel_current_tts()
+        return b"", b""
+
+
+@unittest.skipIf(main is None, "client dependencies are not installed")
+class CancelledAlertTest(unittest.TestCase):
+    def _client(self, *, tts_error=None, audio_allowed=True):
+        client = main.FMClient.__new__(main.FMClient)
+        client.db = mock.Mock()
+        client.player = mock.Mock(ffplay="ffplay")
+        client.state = ClientState()
+        client.debug_tts = False
+        client.tts_cache = None
+        client.tts_gain_user = 1.0
+        client.tts_gain_ai = 1.0
+        client._tts_proc_lock = threading.Lock()
+        client._tts_proc = None
+        client._tts_cancelled = False
+        client._state_dirty = threading.Event()
+        client.is_audio_allowed = lambda: audio_allowed
+        client._status_value = "net" if audio_allowed else "off"
+        client._last_status_mode_value = None
+        client._last_status_mode_print_at = 0.0
+
+        audio = {"file": "", "bytes": b"mp3", "lang": "en", "engine": "test"}
+        self.generate = mock.Mock(return_value=audio, side_effect=tts_error)
+        patches = [
+            mock.patch.object(main, "generate_voice_from_text", self.generate),
+            mock.patch.object(main.subprocess, "Popen", side_effect=lambda *a, **k: _CancelledProc(client)),
+        ]
+        for p in patches:
+            p.start()
+            self.addCleanup(p.stop)
+        return client
+
+    def test_cancelled_user_alert_is_not_acked(self):
+        client = self._client()
+        client._process_user_alert(AlertRow(id=1, message="Rain alert | Stay inside", severity=""))
+        client.db.ack_user_alert.assert_not_called()
+
+    def test_cancelled_ai_alert_is_not_acked(self):
+        client = self._client()
+        spoken = client._process_ai_alert(AlertRow(id=5, message="Storm warning", severity="high"), track_id=True)
+        self.assertFalse(spoken)
+        client.db.ack_ai_alert.assert_not_called()
+        self.assertEqual(client.state.last_ai_alert_id, 0)
+
+
+    def test_radio_off_alerts_are_not_acked(self):
+        client = self._client(audio_allowed=False)
+        client._process_user_alert(AlertRow(id=1, message="Rain alert", severity=""))
+        client._process_ai_alert(AlertRow(id=5, message="Storm warning", severity="high"), track_id=True)
+        client.db.ack_user_alert.assert_not_called()
+        client.db.ack_ai_alert.assert_not_called()
+
+    def test_failed_generation_is_acked_after_one_attempt(self):
+        client = self._client(tts_error=RuntimeError("gTTS unreachable"))
+        client._process_user_alert(AlertRow(id=1, message="Rain alert", severity=""))
+        spoken = client._process_ai_alert(AlertRow(id=5, message="Storm warning", severity="high"), track_id=True)
+        self.assertFalse(spoken)
+        self.assertEqual(self.generate.call_count, 2)
+        client.db.ack_user_alert.assert_called_once_with(1)
+        client.db.ack_ai_alert.assert_called_once_with(5)
+        self.assertEqual(client.state.last_ai_alert_id, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from clinet import state
+from clinet.state import ClientState
+
+
+class SaveStateSkipTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+        state._last_saved.clear()
+        self.addCleanup(state._last_saved.clear)
+        self.write = mock.Mock(wraps=state.write_json)
+        patcher = mock.patch.object(state, "write_json", self.write)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_unchanged_save_is_skipped(self):
+        # Relative path, as passed by the CLI default.
+        state.save_state("client_state.json", ClientState(last_music_id=3))
+        state.save_state("client_state.json", ClientState(last_music_id=3))
+        self.assertEqual(self.write.call_count, 1)
+
+    def test_changed_state_is_written(self):
+        state.save_state("client_state.json", ClientState(last_music_id=3))
+        state.save_state("client_state.json", ClientState(last_music_id=4))
+        self.assertEqual(self.write.call_count, 2)
+        self.assertEqual(state.load_state("client_state.json").last_music_id, 4)
+
+    def test_externally_edited_file_is_rewritten(self):
+        state.save_state("client_state.json", ClientState(last_music_id=3))
+        state.write_json("client_state.json", {"last_music_id": 0})
+        st = os.stat("client_state.json")
+        # Make sure the edit is visible even on coarse mtime filesystems.
+        os.utime("client_state.json", ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        state.save_state("client_state.json", ClientState(last_music_id=3))
+        self.assertEqual(state.load_state("client_state.json").last_music_id, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
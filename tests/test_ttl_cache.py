@@ -0,0 +1,57 @@
+import unittest
+from unittest import mock
+
+try:
+    from clinet import mysql_client
+except ImportError:  # mysql-connector-python not installed
+    mysql_client = None
+
+
+@unittest.skipIf(mysql_client is None, "mysql-connector-python is not installed")
+class TTLCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.now = 100.0
+        patcher = mock.patch.object(mysql_client.time, "monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entries_expire_after_ttl(self):
+        cache = mysql_client._TTLCache(2.0)
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.now += 2.0
+        self.assertIs(cache.get("a"), mysql_client._MISS)
+
+    def test_overwriting_a_key_in_a_full_cache_keeps_the_others(self):
+        cache = mysql_client._TTLCache(2.0, maxsize=2)
+        cache.put("max_id", 1)
+        cache.put("latest", "row")
+        cache.put("max_id", 2)
+        self.assertEqual(cache.get("max_id"), 2)
+        self.assertEqual(cache.get("latest"), "row")
+
+    def test_new_key_in_a_full_cache_evicts_the_oldest(self):
+        cache = mysql_client._TTLCache(10.0, maxsize=2)
+        cache.put("a", 1)
+        self.now += 1.0
+        cache.put("b", 2)
+        self.now += 1.0
+        cache.put("c", 3)
+        self.assertIs(cache.get("a"), mysql_client._MISS)
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_new_key_in_a_full_cache_drops_expired_entries_first(self):
+        cache = mysql_client._TTLCache(2.0, maxsize=3)
+        cache.put("old", 0)
+        self.now += 1.5
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.now += 1.0
+        cache.put("c", 3)
+        self.assertIs(cache.get("old"), mysql_client._MISS)
+        self.assertEqual([cache.get(k) for k in ("a", "b", "c")], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from clinet.tts_cache import TTSCache
+
+
+class TTSCacheTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = TTSCache(os.path.join(tmp.name, "tts"), max_entries=2)
+
+    def _entry(self, name: str, mtime: int) -> str:
+        path = os.path.join(self.cache.cache_dir, name + ".mp3")
+        with open(path, "wb") as f:
+            f.write(b"mp3")
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def _names(self):
+        return sorted(os.listdir(self.cache.cache_dir))
+
+    def test_oldest_entries_are_evicted(self):
+        self._entry("a", 1000)
+        self._entry("b", 3000)
+        self._entry("c", 2000)
+        self.cache._evict()
+        self.assertEqual(self._names(), ["b.mp3", "c.mp3"])
+
+    def test_entries_within_the_limit_are_kept(self):
+        self._entry("a", 1000)
+        self._entry("b", 2000)
+        self.cache._evict()
+        self.assertEqual(self._names(), ["a.mp3", "b.mp3"])
+
+    def test_file_removed_during_the_scan_is_skipped(self):
+        gone = self._entry("a", 1000)
+        self._entry("b", 2000)
+        self._entry("c", 3000)
+        real_scandir = os.scandir
+
+        def scandir(path):
+            # Another process deletes "a" between the listing and the stat().
+            entries = list(real_scandir(path))
+            os.remove(gone)
+            return iter(entries)
+
+        with mock.patch("clinet.tts_cache.os.scandir", scandir):
+            self.cache._evict()
+        self.assertEqual(self._names(), ["b.mp3", "c.mp3"])
+
+    def test_other_users_directory_is_refused(self):
+        if not hasattr(os, "getuid"):
+            self.skipTest("POSIX only")
+        with mock.patch("clinet.tts_cache.os.getuid", return_value=os.getuid() + 1):
+            with self.assertRaises(PermissionError):
+                TTSCache(self.cache.cache_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()